@@ -0,0 +1,96 @@
+"""
+Critical path kernels over flat integer arrays
+
+The graph is given in CSR form: the successors of node u are
+succ_idx[succ_ptr[u]:succ_ptr[u + 1]] with matching lags in succ_lag.
+All buffers are array.array('i') (or anything exposing the buffer
+protocol). When numba is installed the kernels are JIT-compiled;
+otherwise they run as plain Python.
+"""
+
+from array import array
+from typing import Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speed-up
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+def build_successors(n: int, edge_src: array, edge_dst: array,
+                     edge_lag: array) -> Tuple[array, array, array, array]:
+    """Convert an edge list into CSR successor lists plus in-degrees"""
+    succ_ptr = array('i', [0]) * (n + 1)
+    for u in edge_src:
+        succ_ptr[u + 1] += 1
+    for i in range(n):
+        succ_ptr[i + 1] += succ_ptr[i]
+
+    succ_idx = array('i', [0]) * len(edge_src)
+    succ_lag = array('i', [0]) * len(edge_src)
+    fill = succ_ptr[:n]
+    in_degree = array('i', [0]) * n
+    for u, v, lag in zip(edge_src, edge_dst, edge_lag):
+        succ_idx[fill[u]] = v
+        succ_lag[fill[u]] = lag
+        fill[u] += 1
+        in_degree[v] += 1
+    return succ_ptr, succ_idx, succ_lag, in_degree
+
+
+@njit(cache=True, boundscheck=False)
+def topological_order(succ_ptr, succ_idx, in_degree, topo):
+    """Kahn's algorithm; fills topo and returns how many nodes were ordered
+
+    in_degree is consumed. Nodes on a cycle are never ordered.
+    """
+    n = len(in_degree)
+    count = 0
+    for i in range(n):
+        if in_degree[i] == 0:
+            topo[count] = i
+            count += 1
+    head = 0
+    while head < count:
+        u = topo[head]
+        head += 1
+        for k in range(succ_ptr[u], succ_ptr[u + 1]):
+            v = succ_idx[k]
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                topo[count] = v
+                count += 1
+    return count
+
+
+@njit(cache=True, boundscheck=False)
+def compute_earliest(durations, succ_ptr, succ_idx, succ_lag, topo, count, earliest_finish):
+    """Forward pass: earliest finish of every ordered node (start at day 0)"""
+    for u in range(len(durations)):
+        earliest_finish[u] = durations[u]
+    for t in range(count):
+        u = topo[t]
+        finish_u = earliest_finish[u]
+        for k in range(succ_ptr[u], succ_ptr[u + 1]):
+            v = succ_idx[k]
+            candidate = finish_u + succ_lag[k] + durations[v]
+            if candidate > earliest_finish[v]:
+                earliest_finish[v] = candidate
+
+
+@njit(cache=True, boundscheck=False)
+def compute_latest(durations, succ_ptr, succ_idx, succ_lag, topo, count, project_end, latest_finish):
+    """Backward pass: latest finish that does not delay project_end"""
+    for u in range(len(durations)):
+        latest_finish[u] = project_end
+    for t in range(count - 1, -1, -1):
+        u = topo[t]
+        for k in range(succ_ptr[u], succ_ptr[u + 1]):
+            v = succ_idx[k]
+            candidate = latest_finish[v] - durations[v] - succ_lag[k]
+            if candidate < latest_finish[u]:
+                latest_finish[u] = candidate
@@ -0,0 +1,191 @@
+"""
+Line counting kernel for ASCII source files
+
+The kernel reproduces ProjectStats._count_lines() for files whose comment
+patterns it knows, given as a bitmask of the syntax flags below. Lines end
+at '\\n', '\\r\\n' or '\\r' (universal newlines) and whitespace is what
+str.isspace() accepts. The kernel gives up on the first non-ASCII byte,
+where decoding and Unicode case mapping come into play. It is only worth
+running compiled, so count_ascii_lines() is None unless numba is installed.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+# Comment syntax flags
+HASH_LINE = 1          # '#' starts a single-line comment
+SLASH_LINE = 2         # '//' starts a single-line comment
+SLASH_BLOCK = 4        # '/*' starts a multi-line comment
+STAR_SLASH_LINE = 8    # any line containing '*/' is a comment
+TRIPLE_QUOTE = 16      # '"""' or "'''" starts a multi-line comment
+END_STAR_SLASH = 32    # '*/' ends a multi-line comment
+END_TRIPLE_QUOTE = 64  # '"""' or "'''" ends a multi-line comment
+
+# ProjectStats.COMMENT_PATTERNS entries, by (regex, comment type)
+_PATTERN_FLAGS = {
+    (r'^\s*#', 'single'): HASH_LINE,
+    (r'^\s*//', 'single'): SLASH_LINE,
+    (r'^\s*/\*', 'multi_start'): SLASH_BLOCK,
+    (r'^\s*"""', 'multi_start'): TRIPLE_QUOTE,
+    (r"^\s*\'\'\'", 'multi_start'): TRIPLE_QUOTE,
+    (r'\*/', 'multi_end'): STAR_SLASH_LINE,
+}
+
+# ProjectStats.MULTILINE_END_TOKENS entries
+_END_TOKEN_FLAGS = {
+    frozenset(): 0,
+    frozenset({'*/'}): END_STAR_SLASH,
+    frozenset({'"""', "'''"}): END_TRIPLE_QUOTE,
+}
+
+
+def syntax_flags(patterns: List[Tuple['re.Pattern', str]], end_tokens: Tuple[str, ...]) -> Optional[int]:
+    """Flags describing an extension's comment patterns and end tokens
+
+    None if the kernel doesn't know one of them.
+    """
+    syntax = _END_TOKEN_FLAGS.get(frozenset(end_tokens))
+    if syntax is None:
+        return None
+    for index, (pattern, comment_type) in enumerate(patterns):
+        flag = _PATTERN_FLAGS.get((pattern.pattern, comment_type))
+        if flag is None or pattern.flags != re.UNICODE:
+            return None
+        if flag == STAR_SLASH_LINE and index != len(patterns) - 1:
+            return None  # The kernel tests it after the anchored patterns
+        syntax |= flag
+    return syntax
+
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # numba is an optional speed-up
+    np = None
+
+if np is not None:
+    _TODO = np.frombuffer(b'TODO', dtype=np.uint8)
+    _FIXME = np.frombuffer(b'FIXME', dtype=np.uint8)
+    _HACK = np.frombuffer(b'HACK', dtype=np.uint8)
+
+    @njit(cache=True, boundscheck=False)
+    def _is_space(c):
+        return c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+
+    @njit(cache=True, boundscheck=False)
+    def _starts_with(buf, pos, end, c0, c1, c2, length):
+        """Whether buf[pos:end] starts with the first length of c0, c1, c2"""
+        if end - pos < length:
+            return False
+        if buf[pos] != c0 or (length > 1 and buf[pos + 1] != c1):
+            return False
+        return length < 3 or buf[pos + 2] == c2
+
+    @njit(cache=True, boundscheck=False)
+    def _contains(buf, start, end, c0, c1, c2, length):
+        """Whether buf[start:end] contains the first length of c0, c1, c2"""
+        for i in range(start, end - length + 1):
+            if _starts_with(buf, i, end, c0, c1, c2, length):
+                return True
+        return False
+
+    @njit(cache=True, boundscheck=False)
+    def _contains_upper(buf, start, end, word):
+        """Whether buf[start:end], upper-cased, contains word"""
+        length = len(word)
+        for i in range(start, end - length + 1):
+            k = 0
+            while k < length:
+                c = buf[i + k]
+                if 97 <= c <= 122:
+                    c -= 32
+                if c != word[k]:
+                    break
+                k += 1
+            if k == length:
+                return True
+        return False
+
+    @njit(cache=True, boundscheck=False)
+    def _ends_comment(buf, start, end, syntax):
+        """Whether buf[start:end] contains a token ending a multi-line comment"""
+        if syntax & END_STAR_SLASH and _contains(buf, start, end, 42, 47, 0, 2):
+            return True
+        if syntax & END_TRIPLE_QUOTE:
+            return (_contains(buf, start, end, 34, 34, 34, 3)
+                    or _contains(buf, start, end, 39, 39, 39, 3))
+        return False
+
+    @njit(cache=True, boundscheck=False)
+    def _scan(buf, syntax, todo, fixme, hack, counts):
+        """Fill counts with (lines, code, comments, blanks, todos, fixmes, hacks)
+
+        Returns False as soon as a non-ASCII byte turns up.
+        """
+        n = len(buf)
+        in_multiline_comment = False
+        i = 0
+        while i < n:
+            start = i
+            while i < n and buf[i] != 10 and buf[i] != 13:
+                if buf[i] >= 128:
+                    return False
+                i += 1
+            end = i
+            if i < n:
+                if buf[i] == 13 and i + 1 < n and buf[i + 1] == 10:
+                    i += 2
+                else:
+                    i += 1
+
+            counts[0] += 1
+            if _contains_upper(buf, start, end, todo):
+                counts[4] += 1
+            if _contains_upper(buf, start, end, fixme):
+                counts[5] += 1
+            if _contains_upper(buf, start, end, hack):
+                counts[6] += 1
+
+            pos = start
+            while pos < end and _is_space(buf[pos]):
+                pos += 1
+            if pos == end:
+                counts[3] += 1
+                continue
+
+            if in_multiline_comment:
+                counts[2] += 1
+                if _ends_comment(buf, start, end, syntax):
+                    in_multiline_comment = False
+                continue
+
+            # Check for comment start, after leading whitespace
+            is_comment = False
+            if syntax & HASH_LINE and buf[pos] == 35:
+                is_comment = True
+            elif syntax & SLASH_LINE and _starts_with(buf, pos, end, 47, 47, 0, 2):
+                is_comment = True
+            elif ((syntax & SLASH_BLOCK and _starts_with(buf, pos, end, 47, 42, 0, 2))
+                  or (syntax & TRIPLE_QUOTE
+                      and (_starts_with(buf, pos, end, 34, 34, 34, 3)
+                           or _starts_with(buf, pos, end, 39, 39, 39, 3)))):
+                is_comment = True
+                # Check if it also ends on same line
+                in_multiline_comment = not _ends_comment(buf, start, end, syntax)
+            elif syntax & STAR_SLASH_LINE and _contains(buf, start, end, 42, 47, 0, 2):
+                is_comment = True
+
+            if is_comment:
+                counts[2] += 1
+            else:
+                counts[1] += 1
+        return True
+
+    def count_ascii_lines(data, syntax: int) -> Optional[Tuple[int, int, int, int, int, int, int]]:
+        """Line counts of bytes-like data, or None if it is not all ASCII"""
+        counts = np.zeros(7, dtype=np.int64)
+        if not _scan(np.frombuffer(data, dtype=np.uint8), syntax, _TODO, _FIXME, _HACK, counts):
+            return None
+        return tuple(int(count) for count in counts)
+else:
+    count_ascii_lines = None
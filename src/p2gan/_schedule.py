@@ -0,0 +1,110 @@
+"""
+Task scheduling kernel over flat integer arrays
+
+Dates are proleptic ordinals, with 0 standing for "not set". Each task
+has a dense ID index (tasks sharing an ID share it); a task is ready once
+every ID it depends on has been scheduled, and a task whose ID is already
+scheduled is skipped. Predecessor end dates are read through pred_pos,
+the position of the task that the ID resolves to (-1 if none).
+
+CSR layout: the dependencies of task i are dep_*[dep_ptr[i]:dep_ptr[i + 1]],
+the distinct predecessor IDs it waits for are wait_ids[wait_ptr[i]:wait_ptr[i + 1]]
+and the tasks waiting on ID k are waiters[waiter_ptr[k]:waiter_ptr[k + 1]].
+When numba is installed the kernel is JIT-compiled; otherwise it runs as
+plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speed-up
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, boundscheck=False)
+def business_end(start, duration):
+    """End ordinal after duration working days, skipping Saturdays and Sundays
+
+    Ordinal 1 (0001-01-01) is a Monday, so the weekday is (ordinal - 1) % 7.
+    """
+    days_added = 0
+    offset = 0
+    while days_added < duration:
+        offset += 1
+        if (start + offset - 1) % 7 < 5:  # Mon-Fri
+            days_added += 1
+    return start + offset
+
+
+@njit(cache=True, boundscheck=False)
+def schedule(project_start, durations, starts, ends, computed, id_idx,
+             dep_ptr, pred_pos, dep_fs, wait_ptr, wait_ids, waiter_ptr, waiters):
+    """Fill in starts/ends of every task, flagging the ones dated in computed"""
+    n = len(durations)
+    scheduled = [False] * (len(waiter_ptr) - 1)
+
+    # First pass: tasks without dependencies
+    for i in range(n):
+        if dep_ptr[i] == dep_ptr[i + 1]:
+            if starts[i] == 0:
+                starts[i] = project_start
+            ends[i] = business_end(starts[i], durations[i])
+            computed[i] = 1
+            scheduled[id_idx[i]] = True
+
+    # Count each remaining task's unscheduled predecessor IDs
+    remaining = [0] * n
+    ready = [0] * n
+    head = 0
+    tail = 0
+    for i in range(n):
+        if dep_ptr[i] != dep_ptr[i + 1]:
+            count = 0
+            for k in range(wait_ptr[i], wait_ptr[i + 1]):
+                if not scheduled[wait_ids[k]]:
+                    count += 1
+            remaining[i] = count
+            if count == 0:
+                ready[tail] = i
+                tail += 1
+
+    while head < tail:
+        i = ready[head]
+        head += 1
+        if scheduled[id_idx[i]]:
+            continue  # Another task with this ID was already scheduled
+
+        latest = project_start
+        for k in range(dep_ptr[i], dep_ptr[i + 1]):
+            j = pred_pos[k]
+            # For FINISH_TO_START dependencies, start after predecessor ends
+            if j >= 0 and ends[j] != 0 and dep_fs[k]:
+                candidate = ends[j] + 1
+                if candidate > latest:
+                    latest = candidate
+
+        if starts[i] == 0:
+            starts[i] = latest
+        ends[i] = business_end(starts[i], durations[i])
+        computed[i] = 1
+        scheduled[id_idx[i]] = True
+
+        task_id = id_idx[i]
+        for k in range(waiter_ptr[task_id], waiter_ptr[task_id + 1]):
+            w = waiters[k]
+            remaining[w] -= 1
+            if remaining[w] == 0:
+                ready[tail] = w
+                tail += 1
+
+    # Remaining tasks, blocked by a cycle or a missing predecessor
+    for i in range(n):
+        if not scheduled[id_idx[i]]:
+            if starts[i] == 0:
+                starts[i] = project_start
+            ends[i] = business_end(starts[i], durations[i])
+            computed[i] = 1
+            scheduled[id_idx[i]] = True
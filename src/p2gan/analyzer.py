@@ -7,12 +7,14 @@ import re
 import ast
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from dataclasses import dataclass
 
 from .models import Project, Task, Resource, Milestone, TaskPriority, DependencyType
 from .stakeholders import StakeholderManager
 
+_DOCSTRING_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+
 
 @dataclass
 class ProjectAnalysis:
@@ -195,7 +197,7 @@ class PythonPackageAnalyzer:
             try:
                 with open(init_path, 'r') as f:
                     content = f.read()
-                    match = re.search(r'"""(.*?)"""', content, re.DOTALL)
+                    match = _DOCSTRING_RE.search(content)
                     if match:
                         return match.group(1).strip()
             except:
@@ -391,7 +393,7 @@ class PythonPackageAnalyzer:
         return base_weeks + complexity_weeks + component_weeks
     
     def generate_gantt_project(self, analysis: ProjectAnalysis, 
-                              start_date: datetime,
+                              start_date: date,
                               team_size: int = 3) -> Project:
         """Generate a GanttProject from analysis results"""
         project = Project(
@@ -125,7 +125,7 @@ def cmd_analyze(args):
     start_date = None
     if args.start_date:
         try:
-            start_date = datetime.strptime(args.start_date, '%Y-%m-%d')
+            start_date = datetime.strptime(args.start_date, '%Y-%m-%d').date()
         except ValueError:
             raise ValueError("Start date must be in YYYY-MM-DD format")
     
@@ -2,12 +2,17 @@
 Advanced GanttProject XML generator with hierarchical task support
 """
 
+import re
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import List, Dict, Any, Optional
 from xml.dom import minidom
 
-from .models import Project, Task, Resource, Milestone, DependencyType
+from .models import Project, Task, Resource, Milestone, DependencyType, _fmt_date
+
+# Text of <notes> and <description> elements, wrapped in CDATA by _format_xml()
+_NOTES_RE = re.compile(r'<notes>(.*?)</notes>', re.DOTALL)
+_DESCRIPTION_RE = re.compile(r'<description>(.*?)</description>', re.DOTALL)
 
 
 class GanttGenerator:
@@ -16,11 +21,17 @@ class GanttGenerator:
     def __init__(self):
         self.task_id_map = {}  # Map original IDs to sequential IDs
         self.next_id = 0
+        self.date_strings = {}  # date -> "YYYY-MM-DD", while generate_xml() adds the tasks
     
     def _ensure_task_dates_calculated(self, project: Project):
         """Ensure all tasks have calculated dates based on dependencies"""
         all_tasks = project.get_all_tasks()
         scheduled_tasks = set()
+        # First task with each ID, which dependencies on that ID read the end date of
+        first_by_id: Dict[int, Task] = {}
+        for task in all_tasks:
+            first_by_id.setdefault(task.id, task)
+        one_day = timedelta(days=1)
         
         # First pass: schedule tasks without dependencies
         for task in all_tasks:
@@ -52,14 +63,9 @@ class GanttGenerator:
                         break
                     
                     # Find dependency task and calculate start date
-                    dep_task = None
-                    for t in all_tasks:
-                        if t.id == dep.to_task_id:
-                            dep_task = t
-                            break
-                    
+                    dep_task = first_by_id.get(dep.to_task_id)
                     if dep_task and dep_task.end_date:
-                        candidate_start = dep_task.end_date + timedelta(days=1)
+                        candidate_start = dep_task.end_date + one_day
                         if candidate_start > latest_end_date:
                             latest_end_date = candidate_start
                 
@@ -83,7 +89,7 @@ class GanttGenerator:
         root.set("name", project.name)
         root.set("company", project.company)
         root.set("webLink", project.web_link)
-        root.set("view-date", project.start_date.strftime('%Y-%m-%d'))
+        root.set("view-date", _fmt_date(project.start_date))
         root.set("view-index", "0")
         root.set("gantt-divider-location", str(project.gantt_divider_location))
         root.set("resource-divider-location", str(project.resource_divider_location))
@@ -102,8 +108,12 @@ class GanttGenerator:
         # Add calendar configuration
         self._add_calendar_config(root, project)
         
-        # Add tasks section
-        self._add_tasks_section(root, project)
+        # Add tasks section, formatting each distinct date once for this export
+        self.date_strings = project._batch_format_dates()
+        try:
+            self._add_tasks_section(root, project)
+        finally:
+            self.date_strings = {}
         
         # Add resources section
         self._add_resources_section(root, project)
@@ -117,6 +127,11 @@ class GanttGenerator:
         # Format and return XML
         return self._format_xml(root)
     
+    def _format_date(self, d: date) -> str:
+        """Format a date using the strings prepared for this export"""
+        formatted = self.date_strings.get(d)
+        return formatted if formatted is not None else _fmt_date(d)
+
     def _add_view_config(self, root: ET.Element):
         """Add view configuration"""
         view = ET.SubElement(root, "view")
@@ -181,14 +196,14 @@ class GanttGenerator:
             self._add_task_element(tasks_root, item, project)
 
     def _build_task_id_map(self, task: Task):
-        """Recursively build task ID map before adding elements"""
-        if task.id not in self.task_id_map:
-            self.task_id_map[task.id] = self.next_id
-            self.next_id += 1
-
-        # Process subtasks
-        for subtask in task.subtasks:
-            self._build_task_id_map(subtask)
+        """Build task ID map (pre-order over the subtree) before adding elements"""
+        stack = [task]
+        while stack:
+            current = stack.pop()
+            if current.id not in self.task_id_map:
+                self.task_id_map[current.id] = self.next_id
+                self.next_id += 1
+            stack.extend(reversed(current.subtasks))
     
     def _add_task_properties(self, tasks_root: ET.Element, project: Project):
         """Add task property definitions"""
@@ -247,32 +262,32 @@ class GanttGenerator:
         # Set dates and duration
         if task.is_summary and task.subtasks:
             # Find earliest start and latest end from all descendants
-            def get_all_leaf_tasks(t):
-                if not t.subtasks:
-                    return [t]
-                leaves = []
-                for st in t.subtasks:
-                    leaves.extend(get_all_leaf_tasks(st))
-                return leaves
-            
-            leaf_tasks = get_all_leaf_tasks(task)
+            leaf_tasks = []
+            stack = [task]
+            while stack:
+                current = stack.pop()
+                if current.subtasks:
+                    stack.extend(current.subtasks)
+                else:
+                    leaf_tasks.append(current)
+
             if leaf_tasks:
                 earliest_start = min((t.start_date for t in leaf_tasks if t.start_date), default=task.start_date)
                 if earliest_start:
-                    task_element.set("start", earliest_start.strftime('%Y-%m-%d'))
+                    task_element.set("start", self._format_date(earliest_start))
             else:
                 if task.start_date:
-                    task_element.set("start", task.start_date.strftime('%Y-%m-%d'))
+                    task_element.set("start", self._format_date(task.start_date))
             # Summary tasks have duration of 0 in GanttProject
             task_element.set("duration", "0")
         else:
             if task.start_date:
-                task_element.set("start", task.start_date.strftime('%Y-%m-%d'))
+                task_element.set("start", self._format_date(task.start_date))
             task_element.set("duration", str(task.duration))
         
         # Set priority (only if not NORMAL/None)
         if task.priority is not None:
-            task_element.set("priority", str(task.priority.value))
+            task_element.set("priority", task.priority.xml)
 
         # Set optional attributes
         if task.color:
@@ -282,11 +297,10 @@ class GanttGenerator:
             task_element.set("shape", task.shape)
 
         if task.web_link:
-            from urllib.parse import quote
-            task_element.set("webLink", quote(task.web_link, safe=''))
+            task_element.set("webLink", task.quoted_web_link())
 
         if task.third_date:
-            task_element.set("thirdDate", task.third_date.strftime('%Y-%m-%d'))
+            task_element.set("thirdDate", self._format_date(task.third_date))
 
         if task.third_date_constraint is not None:
             task_element.set("thirdDate-constraint", str(task.third_date_constraint))
@@ -317,7 +331,7 @@ class GanttGenerator:
             if successor_id in self.task_id_map:
                 depend = ET.SubElement(task_element, "depend")
                 depend.set("id", str(self.task_id_map[successor_id]))
-                depend.set("type", str(dependency.type.value))
+                depend.set("type", dependency.type.xml)
                 depend.set("difference", str(dependency.lag))
                 depend.set("hardness", dependency.hardness if hasattr(dependency, 'hardness') else "Strong")
         
@@ -363,8 +377,8 @@ class GanttGenerator:
         vacations_root = ET.SubElement(root, "vacations")
         for vacation in project.vacations:
             vacation_elem = ET.SubElement(vacations_root, "vacation")
-            vacation_elem.set("start", vacation.start_date.strftime('%Y-%m-%d'))
-            vacation_elem.set("end", vacation.end_date.strftime('%Y-%m-%d'))
+            vacation_elem.set("start", _fmt_date(vacation.start_date))
+            vacation_elem.set("end", _fmt_date(vacation.end_date))
             vacation_elem.set("resourceid", str(vacation.resource_id))
 
         # Add previous (empty)
@@ -384,8 +398,6 @@ class GanttGenerator:
     
     def _format_xml(self, root: ET.Element) -> str:
         """Format XML with proper indentation and CDATA for notes and description"""
-        import re
-
         # First, remove the _cdata marker attributes before serializing
         for elem in root.iter():
             if elem.get("_cdata") == "true":
@@ -394,18 +406,8 @@ class GanttGenerator:
         rough_string = ET.tostring(root, 'unicode')
 
         # Wrap notes and description content in CDATA
-        rough_string = re.sub(
-            r'<notes>(.*?)</notes>',
-            r'<notes><![CDATA[\1]]></notes>',
-            rough_string,
-            flags=re.DOTALL
-        )
-        rough_string = re.sub(
-            r'<description>(.*?)</description>',
-            r'<description><![CDATA[\1]]></description>',
-            rough_string,
-            flags=re.DOTALL
-        )
+        rough_string = _NOTES_RE.sub(r'<notes><![CDATA[\1]]></notes>', rough_string)
+        rough_string = _DESCRIPTION_RE.sub(r'<description><![CDATA[\1]]></description>', rough_string)
 
         reparsed = minidom.parseString(rough_string)
         formatted = reparsed.toprettyxml(indent="  ")
@@ -445,7 +447,7 @@ class GanttProjectBuilder:
         return project
     
     def from_python_package(self, package_path: str, output_path: str, 
-                           start_date: Optional[datetime] = None):
+                           start_date: Optional[date] = None):
         """Create GanttProject file from Python package analysis"""
         from .analyzer import PythonPackageAnalyzer
         from pathlib import Path
@@ -455,7 +457,7 @@ class GanttProjectBuilder:
         
         project = analyzer.generate_gantt_project(
             analysis,
-            start_date or datetime.now(),
+            start_date or date.today(),
             team_size=3
         )
         
@@ -2,14 +2,76 @@
 Core data models for GanttProject representation
 """
 
-import uuid
+import os
+import sys
+import threading
+from array import array
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from enum import Enum
+from urllib.parse import quote
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+ only)
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class TaskPriority(Enum):
+
+class _UidPool:
+    """Hands out random (version 4) UUIDs as hex, reading os.urandom() once per batch"""
+
+    BATCH = 4096  # UIDs per os.urandom() call
+    # bytes.translate() tables stamping the RFC 4122 version and variant bits
+    _VERSION = bytes((b & 0x0f) | 0x40 for b in range(256))
+    _VARIANT = bytes((b & 0x3f) | 0x80 for b in range(256))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buf = b''
+        self._offset = 0
+
+    def reset(self):
+        """Discard buffered randomness (a forked child must not reuse the parent's)"""
+        self._buf = b''
+        self._offset = 0
+
+    def next(self) -> str:
+        """Return the next UID as 32 lowercase hex digits"""
+        with self._lock:
+            offset = self._offset
+            if offset + 16 > len(self._buf):
+                buf = bytearray(os.urandom(16 * self.BATCH))
+                buf[6::16] = buf[6::16].translate(self._VERSION)
+                buf[8::16] = buf[8::16].translate(self._VARIANT)
+                self._buf = bytes(buf)
+                offset = 0
+            self._offset = offset + 16
+            return self._buf[offset:offset + 16].hex()
+
+
+_uid_pool = _UidPool()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_uid_pool.reset)
+
+
+def _as_date(value):
+    """Drop the time of day from a datetime; dates and None pass through"""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _fmt_date(d: date) -> str:
+    """Format a date as YYYY-MM-DD (cheaper than strftime)"""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+class _XmlEnum(Enum):
+    """An enum whose values are written out as XML attributes"""
+
+    def __init__(self, value):
+        # Pre-rendered, so exports don't call str() per task
+        self.xml = sys.intern(str(value))
+
+
+class TaskPriority(_XmlEnum):
     """Task priority levels matching GanttProject - VERIFIED from real .gan files"""
     LOW = 0
     HIGH = 2
@@ -18,7 +80,7 @@ class TaskPriority(Enum):
     # Note: NORMAL has no priority attribute in XML (omitted = default)
 
 
-class DependencyType(Enum):
+class DependencyType(_XmlEnum):
     """Dependency types in GanttProject - VERIFIED from real .gan files"""
     START_TO_START = 1   # SS - Task starts when predecessor starts
     FINISH_TO_START = 2  # FS - Task starts when predecessor finishes (most common)
@@ -26,7 +88,7 @@ class DependencyType(Enum):
     START_TO_FINISH = 4  # SF - Task finishes when predecessor starts (rare)
 
 
-class ConstraintType(Enum):
+class ConstraintType(_XmlEnum):
     """Task constraint types"""
     AS_SOON_AS_POSSIBLE = "asap"
     AS_LATE_AS_POSSIBLE = "alap"
@@ -38,7 +100,53 @@ class ConstraintType(Enum):
     FINISH_NO_LATER_THAN = "fnlt"
 
 
-@dataclass
+def _strongly_connected_components(graph: Dict[int, List[int]]) -> List[List[int]]:
+    """Tarjan's algorithm with an explicit stack instead of recursion
+
+    graph maps each node to its successors; successors missing from the
+    mapping are treated as nodes without outgoing edges.
+    """
+    index: Dict[int, int] = {}
+    lowlink: Dict[int, int] = {}
+    on_stack = set()
+    stack: List[int] = []
+    components: List[List[int]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    break
+                if succ in on_stack and index[succ] < lowlink[node]:
+                    lowlink[node] = index[succ]
+            else:
+                work.pop()
+                if work and lowlink[node] < lowlink[work[-1][0]]:
+                    lowlink[work[-1][0]] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Resource:
     """Represents a project resource (person, equipment, etc.)"""
     id: int
@@ -48,6 +156,10 @@ class Resource:
     phone: str = ""
     standard_rate: float = 0.0
 
+    def __post_init__(self):
+        """Share one string object per distinct role"""
+        self.function = sys.intern(self.function)
+
     def to_xml_dict(self) -> Dict[str, Any]:
         """Convert to XML-compatible dictionary"""
         return {
@@ -59,7 +171,7 @@ class Resource:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ResourceAllocation:
     """Links a resource to a task with allocation parameters"""
     task_id: int
@@ -68,6 +180,10 @@ class ResourceAllocation:
     responsible: bool = False  # Is this resource responsible for the task?
     load: float = 100.0  # Allocation percentage (can exceed 100%)
 
+    def __post_init__(self):
+        """Share one string object per distinct role"""
+        self.function = sys.intern(self.function)
+
     def to_xml_dict(self) -> Dict[str, Any]:
         """Convert to XML-compatible dictionary"""
         return {
@@ -79,23 +195,28 @@ class ResourceAllocation:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Vacation:
     """Resource vacation/unavailability period"""
     resource_id: int
-    start_date: datetime
-    end_date: datetime
+    start_date: date
+    end_date: date
+
+    def __post_init__(self):
+        """Store plain dates even when given datetimes"""
+        self.start_date = _as_date(self.start_date)
+        self.end_date = _as_date(self.end_date)
 
     def to_xml_dict(self) -> Dict[str, Any]:
         """Convert to XML-compatible dictionary"""
         return {
-            'start': self.start_date.strftime('%Y-%m-%d'),
-            'end': self.end_date.strftime('%Y-%m-%d'),
+            'start': _fmt_date(self.start_date),
+            'end': _fmt_date(self.end_date),
             'resourceid': str(self.resource_id)
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Role:
     """Project role definition"""
     id: int
@@ -109,7 +230,7 @@ class Role:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CustomTaskProperty:
     """Definition of a custom task property"""
     id: str  # e.g., "tpc0", "tpc1"
@@ -131,7 +252,7 @@ class CustomTaskProperty:
         return attrs
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Dependency:
     """Represents a task dependency - stored IN predecessor task, points TO successor task
 
@@ -146,6 +267,10 @@ class Dependency:
     lag: int = 0  # Days of lag (positive) or lead (negative)
     hardness: str = "Strong"  # "Strong" or "Rubber"
 
+    def __post_init__(self):
+        """Share one string object per hardness value"""
+        self.hardness = sys.intern(self.hardness)
+
     # Legacy aliases for backwards compatibility
     @property
     def to_task_id(self) -> int:
@@ -156,21 +281,35 @@ class Dependency:
         """Convert to XML-compatible dictionary"""
         return {
             'id': str(self.successor_id),
-            'type': str(self.type.value),
+            'type': self.type.xml,
             'difference': str(self.lag),
             'hardness': self.hardness
         }
 
 
-@dataclass
+# Container attributes Task creates on first access instead of in __init__
+_TASK_LAZY_CONTAINERS = {
+    'subtasks': list,
+    'resource_ids': lambda: array('i'),
+    'allocations': dict,
+    'dependencies': list,
+    'custom_properties': dict,
+}
+
+
+@dataclass(init=False, **_DATACLASS_OPTIONS)
 class Task:
-    """Represents a project task or subtask"""
+    """Represents a project task or subtask
+
+    Empty containers (subtasks, resource_ids, allocations, dependencies,
+    custom_properties) are only allocated when first accessed.
+    """
     id: int
     name: str
     duration: int  # in days
-    uid: str = field(default_factory=lambda: uuid.uuid4().hex)  # UUID without hyphens
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
+    uid: str = field(default_factory=_uid_pool.next)  # uuid4().hex format
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
     progress: int = 0  # 0-100
     priority: Optional[TaskPriority] = None  # None = NORMAL (no attribute in XML)
     
@@ -180,13 +319,13 @@ class Task:
     level: int = 0  # indentation level
     
     # Resources & Dependencies
-    resource_ids: List[int] = field(default_factory=list)
+    resource_ids: array = field(default_factory=lambda: array('i'))  # compact int array
     allocations: Dict[int, float] = field(default_factory=dict)  # resource_id: percentage
     dependencies: List[Dependency] = field(default_factory=list)
     
     # Constraints
     constraint_type: Optional[ConstraintType] = None
-    constraint_date: Optional[datetime] = None
+    constraint_date: Optional[date] = None
     
     # Additional properties
     is_milestone: bool = False
@@ -204,9 +343,77 @@ class Task:
     custom_properties: Dict[str, str] = field(default_factory=dict)
 
     # Constraints
-    third_date: Optional[datetime] = None  # Constraint date
+    third_date: Optional[date] = None  # Constraint date
     third_date_constraint: Optional[int] = None  # 0 or 1 (constraint enabled/disabled)
+
+    # Owning project, set when the task is added to one (used to invalidate its caches)
+    _project: Optional['Project'] = field(default=None, init=False, repr=False, compare=False)
+    # (web_link, quoted web_link) memo for XML export
+    _web_link_quoted: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False,
+                                                        compare=False)
     
+    def __init__(self, id: int, name: str, duration: int, uid: Optional[str] = None,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 progress: int = 0, priority: Optional[TaskPriority] = None,
+                 parent_id: Optional[int] = None, subtasks: Optional[List['Task']] = None,
+                 level: int = 0, resource_ids: Optional[List[int]] = None,
+                 allocations: Optional[Dict[int, float]] = None,
+                 dependencies: Optional[List[Dependency]] = None,
+                 constraint_type: Optional[ConstraintType] = None,
+                 constraint_date: Optional[date] = None,
+                 is_milestone: bool = False, is_summary: bool = False,
+                 notes: str = "", web_link: str = "",
+                 color: Optional[str] = None, shape: Optional[str] = None,
+                 cost_manual_value: Optional[float] = None, cost_calculated: bool = True,
+                 custom_properties: Optional[Dict[str, str]] = None,
+                 third_date: Optional[date] = None,
+                 third_date_constraint: Optional[int] = None):
+        self.id = id
+        self.name = name
+        self.duration = duration
+        self.uid = _uid_pool.next() if uid is None else uid
+        self.start_date = _as_date(start_date)
+        self.end_date = _as_date(end_date)
+        self.progress = progress
+        self.priority = priority
+        self.parent_id = parent_id
+        self.level = level
+        self.constraint_type = constraint_type
+        self.constraint_date = _as_date(constraint_date)
+        self.is_milestone = is_milestone
+        self.is_summary = is_summary
+        self.notes = notes
+        self.web_link = web_link
+        self.color = color
+        self.shape = shape
+        self.cost_manual_value = cost_manual_value
+        self.cost_calculated = cost_calculated
+        self.third_date = _as_date(third_date)
+        self.third_date_constraint = third_date_constraint
+        self._project = None
+        self._web_link_quoted = None
+
+        if subtasks is not None:
+            self.subtasks = subtasks
+        if resource_ids is not None:
+            self.resource_ids = (resource_ids if isinstance(resource_ids, array)
+                                 else array('i', resource_ids))
+        if allocations is not None:
+            self.allocations = allocations
+        if dependencies is not None:
+            self.dependencies = dependencies
+        if custom_properties is not None:
+            self.custom_properties = custom_properties
+
+    def __getattr__(self, name: str):
+        """Create an empty container attribute on first access"""
+        factory = _TASK_LAZY_CONTAINERS.get(name)
+        if factory is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = factory()
+        setattr(self, name, value)
+        return value
+
     def add_subtask(self, subtask: 'Task'):
         """Add a subtask and update hierarchy"""
         subtask.parent_id = self.id
@@ -215,6 +422,8 @@ class Task:
         self.is_summary = True
         if not self.is_milestone:
             self.duration = 0  # Summary tasks have 0 duration in GanttProject
+        if self._project is not None:
+            self._project._adopt(subtask)
     
     def add_dependency(self, target_task_id: int,
                       dep_type: DependencyType = DependencyType.FINISH_TO_START,
@@ -227,34 +436,42 @@ class Task:
         )
         self.dependencies.append(dep)
     
-    def calculate_dates(self, project_start: datetime, 
-                       skip_weekends: bool = True) -> Tuple[datetime, datetime]:
+    def calculate_dates(self, project_start: date,
+                       skip_weekends: bool = True) -> Tuple[date, date]:
         """Calculate start and end dates based on duration"""
         if self.start_date is None:
-            self.start_date = project_start
+            self.start_date = _as_date(project_start)
         
-        # Calculate end date considering weekends
+        # Calculate end date considering weekends, stepping over integer
+        # ordinals; ordinal 1 (0001-01-01) is a Monday, so weekday = (ordinal - 1) % 7
+        start_ordinal = self.start_date.toordinal()
         days_added = 0
-        current_date = self.start_date
-        
+        offset = 0
+
         while days_added < self.duration:
-            current_date += timedelta(days=1)
-            if not skip_weekends or current_date.weekday() < 5:  # Mon-Fri
+            offset += 1
+            if not skip_weekends or (start_ordinal + offset - 1) % 7 < 5:  # Mon-Fri
                 days_added += 1
-        
-        self.end_date = current_date
+
+        self.end_date = self.start_date + timedelta(days=offset)
         return self.start_date, self.end_date
     
+    def quoted_web_link(self) -> str:
+        """Return web_link percent-encoded for XML, memoized per value"""
+        memo = self._web_link_quoted
+        if memo is None or memo[0] != self.web_link:
+            memo = (self.web_link, quote(self.web_link, safe=''))
+            self._web_link_quoted = memo
+        return memo[1]
+
     def to_xml_dict(self) -> Dict[str, Any]:
         """Convert to XML-compatible dictionary"""
-        from urllib.parse import quote
-
         xml_dict = {
             'id': str(self.id),
             'uid': self.uid,
             'name': self.name,
             'meeting': 'true' if self.is_milestone else 'false',
-            'start': self.start_date.strftime('%Y-%m-%d') if self.start_date else '',
+            'start': _fmt_date(self.start_date) if self.start_date else '',
             'duration': str(self.duration),
             'complete': str(self.progress),
             'expand': 'true'
@@ -262,7 +479,7 @@ class Task:
 
         # Only include priority if not NORMAL (None)
         if self.priority is not None:
-            xml_dict['priority'] = str(self.priority.value)
+            xml_dict['priority'] = self.priority.xml
 
         # Optional attributes
         if self.color:
@@ -270,9 +487,9 @@ class Task:
         if self.shape:
             xml_dict['shape'] = self.shape
         if self.web_link:
-            xml_dict['webLink'] = quote(self.web_link, safe='')
+            xml_dict['webLink'] = self.quoted_web_link()
         if self.third_date:
-            xml_dict['thirdDate'] = self.third_date.strftime('%Y-%m-%d')
+            xml_dict['thirdDate'] = _fmt_date(self.third_date)
         if self.third_date_constraint is not None:
             xml_dict['thirdDate-constraint'] = str(self.third_date_constraint)
 
@@ -287,7 +504,9 @@ class Task:
 @dataclass
 class Milestone(Task):
     """Specialized task representing a milestone"""
-    def __init__(self, id: int, name: str, date: datetime, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, id: int, name: str, date: date, **kwargs):
         super().__init__(
             id=id,
             name=name,
@@ -299,11 +518,29 @@ class Milestone(Task):
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
+class TaskArrays:
+    """Struct-of-arrays snapshot of a project's tasks for whole-project sweeps
+
+    Position i in every column refers to tasks[i]. Dates are stored as
+    proleptic ordinals (0 = unset); dependency edges point from the
+    predecessor index to the successor index.
+    """
+    tasks: List[Task]
+    durations: array
+    starts: array
+    ends: array
+    parent_idx: array  # -1 for top-level tasks
+    edge_src: array
+    edge_dst: array
+    edge_lag: array
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Project:
     """Represents a complete GanttProject"""
     name: str
-    start_date: datetime
+    start_date: date
     company: str = ""
     web_link: str = ""
     description: str = ""
@@ -326,7 +563,7 @@ class Project:
     custom_task_properties: List[CustomTaskProperty] = field(default_factory=list)
 
     # Settings
-    view_date: Optional[datetime] = None
+    view_date: Optional[date] = None
     gantt_divider_location: int = 300
     resource_divider_location: int = 300
     version: str = "3.2.3200"
@@ -335,17 +572,34 @@ class Project:
     # Calendar
     calendar_base_id: Optional[str] = None  # e.g., "us.federal"
     working_days: List[int] = field(default_factory=lambda: [1, 2, 3, 4, 5])  # Mon-Fri
-    holidays: List[datetime] = field(default_factory=list)
+    holidays: List[date] = field(default_factory=list)
 
     # Baselines for tracking
     baselines: List[Dict[str, Any]] = field(default_factory=list)
-    
+
+    # Lookup caches, built lazily and dropped whenever the task tree changes
+    _flat_cache: Optional[List[Task]] = field(default=None, init=False, repr=False, compare=False)
+    _name_index: Optional[Dict[str, Task]] = field(default=None, init=False, repr=False, compare=False)
+    _cache_key: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+    _soa: Optional[TaskArrays] = field(default=None, init=False, repr=False, compare=False)
+    # Resource name index; names are assumed fixed once a resource is added
+    _resource_by_name: Optional[Dict[str, Resource]] = field(default=None, init=False, repr=False,
+                                                            compare=False)
+    _resource_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Store plain dates even when given datetimes"""
+        self.start_date = _as_date(self.start_date)
+        self.view_date = _as_date(self.view_date)
+        self.holidays = [_as_date(d) for d in self.holidays]
+
     def add_task(self, task: Task, parent_task: Optional[Task] = None):
         """Add a task to the project"""
         if parent_task:
             parent_task.add_subtask(task)
         else:
             self.tasks.append(task)
+        self._adopt(task)
     
     def add_milestone(self, milestone: Milestone, parent_task: Optional[Task] = None):
         """Add a milestone to the project"""
@@ -353,63 +607,186 @@ class Project:
             parent_task.add_subtask(milestone)
         else:
             self.milestones.append(milestone)
+        self._adopt(milestone)
+
+    def _adopt(self, task: Task):
+        """Attach a task subtree to this project and invalidate lookup caches"""
+        stack = [task]
+        while stack:
+            current = stack.pop()
+            current._project = self
+            stack.extend(current.subtasks)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Drop cached task lookups (call after renaming tasks in place)"""
+        self._flat_cache = None
+        self._name_index = None
+        self._soa = None
+
+    def _caches_valid(self) -> bool:
+        """Check the caches against direct appends to tasks/milestones"""
+        return (self._flat_cache is not None
+                and self._cache_key == (len(self.tasks), len(self.milestones)))
     
     def add_resource(self, resource: Resource) -> Resource:
         """Add a resource to the project"""
+        index_current = (self._resource_by_name is not None
+                         and self._resource_count == len(self.resources))
         self.resources.append(resource)
+        if index_current:
+            self._resource_by_name.setdefault(resource.name, resource)
+            self._resource_count += 1
         return resource
     
     def find_task_by_name(self, name: str) -> Optional[Task]:
         """Find a task by name (searches all levels)"""
-        def search_tasks(tasks: List[Task]) -> Optional[Task]:
-            for task in tasks:
-                if task.name == name:
-                    return task
-                if task.subtasks:
-                    found = search_tasks(task.subtasks)
-                    if found:
-                        return found
-            return None
-        
-        # Search in both tasks and milestones
-        result = search_tasks(self.tasks)
-        if not result:
-            result = search_tasks([m for m in self.milestones])
-        return result
+        if self._name_index is None or not self._caches_valid():
+            # First occurrence wins: tasks (depth-first) before milestones
+            index: Dict[str, Task] = {}
+            for task in self._all_tasks():
+                index.setdefault(task.name, task)
+            self._name_index = index
+        return self._name_index.get(name)
     
     def find_resource_by_name(self, name: str) -> Optional[Resource]:
         """Find a resource by name"""
-        for resource in self.resources:
-            if resource.name == name:
-                return resource
-        return None
+        if self._resource_by_name is None or self._resource_count != len(self.resources):
+            index: Dict[str, Resource] = {}
+            for resource in self.resources:
+                index.setdefault(resource.name, resource)
+            self._resource_by_name = index
+            self._resource_count = len(self.resources)
+        return self._resource_by_name.get(name)
     
     def get_all_tasks(self, include_milestones: bool = True) -> List[Task]:
         """Get flat list of all tasks including subtasks"""
-        all_tasks = []
-        
-        def collect_tasks(tasks: List[Task]):
-            for task in tasks:
-                all_tasks.append(task)
-                if task.subtasks:
-                    collect_tasks(task.subtasks)
-        
-        collect_tasks(self.tasks)
         if include_milestones:
-            collect_tasks(self.milestones)
-        
-        return all_tasks
-    
+            return list(self._all_tasks())
+        return list(self._walk_tasks(self.tasks))
+
+    def _all_tasks(self) -> List[Task]:
+        """The cached flat list of all tasks and milestones, rebuilt if stale
+
+        Rebuilding drops the other lookup caches, which were built from the
+        stale list. Callers must not modify the returned list.
+        """
+        if not self._caches_valid():
+            self._invalidate_caches()
+            all_tasks = list(self._walk_tasks(self.tasks))
+            all_tasks.extend(self._walk_tasks(self.milestones))
+            self._flat_cache = all_tasks
+            self._cache_key = (len(self.tasks), len(self.milestones))
+        return self._flat_cache
+
+    def iter_all_tasks(self, include_milestones: bool = True) -> Iterator[Task]:
+        """Iterate over all tasks including subtasks without building a list"""
+        if include_milestones and self._caches_valid():
+            yield from self._flat_cache
+            return
+        yield from self._walk_tasks(self.tasks)
+        if include_milestones:
+            yield from self._walk_tasks(self.milestones)
+
+    @staticmethod
+    def _walk_tasks(tasks: List[Task]) -> Iterator[Task]:
+        """Walk a task forest depth-first (pre-order) without recursion"""
+        stack = list(reversed(tasks))
+        while stack:
+            task = stack.pop()
+            yield task
+            if task.subtasks:
+                stack.extend(reversed(task.subtasks))
+
+    def _batch_format_dates(self) -> Dict[date, str]:
+        """Format every distinct task date once, for a full-project export
+
+        The strings are only kept by the caller, so they don't build up
+        across exports of a changing project.
+        """
+        formatted = {}
+        for task in self.iter_all_tasks():
+            for d in (task.start_date, task.third_date):
+                if d is not None and d not in formatted:
+                    formatted[d] = _fmt_date(d)
+        return formatted
+
+    def rebuild_soa(self) -> TaskArrays:
+        """Rebuild the struct-of-arrays view of all tasks and dependencies"""
+        tasks = self.get_all_tasks()
+        index: Dict[int, int] = {}
+        for i, task in enumerate(tasks):
+            index.setdefault(task.id, i)
+
+        edge_src, edge_dst, edge_lag = array('i'), array('i'), array('i')
+        for i, task in enumerate(tasks):
+            for dep in task.dependencies:
+                j = index.get(dep.successor_id)
+                if j is not None:
+                    edge_src.append(i)
+                    edge_dst.append(j)
+                    edge_lag.append(dep.lag)
+
+        self._soa = TaskArrays(
+            tasks=tasks,
+            durations=array('i', (t.duration for t in tasks)),
+            starts=array('l', (t.start_date.toordinal() if t.start_date else 0 for t in tasks)),
+            ends=array('l', (t.end_date.toordinal() if t.end_date else 0 for t in tasks)),
+            parent_idx=array('i', (index.get(t.parent_id, -1) if t.parent_id is not None else -1
+                                   for t in tasks)),
+            edge_src=edge_src,
+            edge_dst=edge_dst,
+            edge_lag=edge_lag,
+        )
+        return self._soa
+
     def calculate_critical_path(self) -> List[Task]:
-        """Calculate the critical path through the project"""
-        # TODO: Implement critical path algorithm
-        pass
+        """Calculate the critical path through the project
+
+        Returns the non-summary tasks with zero slack in dependency order.
+        Tasks caught in a dependency cycle are left out.
+        """
+        from ._critical_path import (
+            build_successors, topological_order, compute_earliest, compute_latest
+        )
+
+        soa = self.rebuild_soa()
+        n = len(soa.tasks)
+        durations = soa.durations
+        succ_ptr, succ_idx, succ_lag, in_degree = build_successors(
+            n, soa.edge_src, soa.edge_dst, soa.edge_lag
+        )
+
+        topo = array('i', [0]) * n
+        count = topological_order(succ_ptr, succ_idx, in_degree, topo)
+        del topo[count:]
+
+        earliest_finish = array('i', [0]) * n
+        compute_earliest(durations, succ_ptr, succ_idx, succ_lag, topo, count, earliest_finish)
+
+        project_end = max((earliest_finish[u] for u in topo), default=0)
+        latest_finish = array('i', [0]) * n
+        compute_latest(durations, succ_ptr, succ_idx, succ_lag, topo, count, project_end,
+                       latest_finish)
+
+        return [soa.tasks[u] for u in topo
+                if latest_finish[u] == earliest_finish[u] and not soa.tasks[u].is_summary]
     
     def validate(self) -> List[str]:
         """Validate project structure and return warnings"""
         warnings = []
-        
+
         # Check for circular dependencies
+        graph: Dict[int, List[int]] = {}
+        for task in self.iter_all_tasks():
+            graph.setdefault(task.id, []).extend(d.successor_id for d in task.dependencies)
+        for component in _strongly_connected_components(graph):
+            if len(component) > 1:
+                ids = ', '.join(str(task_id) for task_id in sorted(component))
+                warnings.append(f"Circular dependency between tasks {ids}")
+            elif component[0] in graph.get(component[0], ()):
+                warnings.append(f"Task {component[0]} depends on itself")
+
         # Check for resource overallocation
         # Check for invalid dates
         # Check for orphaned tasks
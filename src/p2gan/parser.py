@@ -2,14 +2,123 @@
 Enhanced markdown parser with hierarchical task support and advanced dependency management
 """
 
+import mmap
+import os
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 from pathlib import Path
 from .models import Project, Task, Resource, Milestone, TaskPriority, DependencyType
 from .stakeholders import StakeholderManager, get_default_manager
 
 
+# Leading token of the unindented lines _parse_lines() acts on, keyed by the line's
+# first character (a one-level trie); the alternatives of each pattern are tried in order
+_LINE_RES = {
+    '#': re.compile(
+        r'(?P<project># Project:)|(?P<resources>## Resources)|(?P<tasks>## Tasks)'
+        r'|(?P<milestones>## Milestones)|(?P<header>###)'
+    ).match,
+    '*': re.compile(r'(?P<start_date>\*\*Start Date:\*\*)|(?P<duration>\*\*Duration:\*\*)').match,
+    '-': re.compile(r'(?P<checkbox>- \[ \])|(?P<item>- )').match,
+}
+_RESOURCE_RE = re.compile(r'^-\s*([^(]+)(?:\(([^)]+)\))?')
+_MILESTONE_RE = re.compile(r'^-\s*\[\s*\]\s*([^(]+)\s*(?:\(([^)]+)\))?')
+_TASK_RE = re.compile(r'^-\s*\*\*([^*]+)\*\*\s*(?:\(([^)]+)\))?')
+_DAYS_RE = re.compile(r'(\d+)\s*days?')
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_AFTER_RE = re.compile(r'After\s+(.+)', re.IGNORECASE)
+_PROGRESS_RE = re.compile(r'(\d+)%?')
+
+# Task priority by lower-cased property value, also keyed by the title and
+# upper-case spellings so the usual ones are found without lower()
+_PRIORITIES = {
+    'low': TaskPriority.LOW,
+    'medium': None,  # Normal priority = no attribute in XML
+    'normal': None,
+    'high': TaskPriority.HIGH,
+    'highest': TaskPriority.HIGHEST,
+    'critical': TaskPriority.HIGHEST
+}
+_PRIORITY_MAP = {
+    spelling: priority
+    for name, priority in _PRIORITIES.items()
+    for spelling in (name, name.title(), name.upper())
+}
+
+
+_parse_iso = date.fromisoformat
+
+
+def _parse_ymd(date_str: str) -> date:
+    """Parse a YYYY-MM-DD date; raises ValueError like strptime('%Y-%m-%d')
+
+    The common zero-padded ASCII form goes to date.fromisoformat(); anything
+    else (e.g. '2025-1-5'), and anything it rejects, is left to strptime.
+    """
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-' and date_str.isascii():
+        try:
+            return _parse_iso(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text as text.split('\n') would, without building the list"""
+    start = 0
+    find = text.find
+    while True:
+        end = find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _tee_resource_section(lines: Iterable[str], section: List[str]) -> Iterator[str]:
+    """Pass lines through, collecting the ones StakeholderManager.import_from_markdown() reads
+
+    That is the first line ending in '## Resources' (plus optional trailing
+    whitespace) and the lines after it up to the end of the run of '- ' lines
+    that follows any whitespace-only ones. Joined with '\n', section then yields the same
+    stakeholders as the full text would.
+    """
+    lines = iter(lines)
+    for line in lines:
+        yield line
+        if line.rstrip().endswith('## Resources'):
+            section.append(line)
+            break
+    for line in lines:
+        yield line
+        section.append(line)
+        if line and not line.isspace():
+            if line.startswith('- '):
+                for line in lines:
+                    yield line
+                    if not line.startswith('- '):
+                        break
+                    section.append(line)
+            break
+    yield from lines
+
+
+class _HierarchyState:
+    """Innermost open phase / sub-phase / task group while parsing the task list"""
+    __slots__ = ('phase', 'subphase', 'taskgroup')
+
+    def __init__(self):
+        self.phase = None
+        self.subphase = None
+        self.taskgroup = None
+
+
 class MarkdownParser:
     """Enhanced parser for project markdown files"""
     
@@ -21,72 +130,63 @@ class MarkdownParser:
         self.resource_counter = 0
         self.task_name_to_id = {}  # Map task names to IDs for dependency resolution
         self.pending_dependencies = []  # Dependencies to resolve after all tasks are created
+        self._tasks_by_id: Dict[int, Task] = {}  # Tasks of the current project by ID
         
     def parse_file(self, filepath: str) -> Project:
-        """Parse a markdown file and return a Project object"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        return self.parse_content(content)
+        """Parse a markdown file and return a Project object
+
+        The file is memory-mapped and streamed line by line; only non-blank
+        lines are decoded, and of the full text just the resource section
+        read by the stakeholder import is kept.
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return self.parse_content('')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # bytes.splitlines() breaks on \n, \r\n and \r, like text-mode reads
+                lines = (
+                    line.decode('utf-8') if line and not line.isspace() else ''
+                    for chunk in iter(mm.readline, b'')
+                    for line in chunk.splitlines()
+                )
+                if mm[-1] in b'\r\n':
+                    lines = chain(lines, ('',))  # As str.split('\n') would end
+                section: List[str] = []
+                self._parse_lines(_tee_resource_section(lines, section))
+        
+        return self._finish_project('\n'.join(section))
     
     def parse_content(self, content: str) -> Project:
         """Parse markdown content and return a Project object"""
-        lines = content.split('\n')
-        current_phase = None
-        current_subphase = None
-        current_taskgroup = None
-        
-        for line_num, line in enumerate(lines):
-            if not line.strip():
-                continue
-            
-            # Detect section headers
-            if line.startswith('# Project:'):
-                self._parse_project_header(line)
-            elif line.startswith('**Start Date:**'):
-                self._parse_start_date(line)
-            elif line.startswith('**Duration:**'):
-                self._parse_duration(line)
-            elif line.startswith('## Resources'):
-                self.current_section = 'resources'
-                continue
-            elif line.startswith('## Tasks'):
-                self.current_section = 'tasks'
-                continue
-            elif line.startswith('## Milestones'):
-                self.current_section = 'milestones'
-                continue
-            elif line.startswith('###'):
-                # Phase header
-                if self.current_section == 'tasks':
-                    current_phase = self._parse_phase(line)
-                    current_subphase = None  # Reset subphase
-                    current_taskgroup = None  # Reset task group
-            elif line.startswith('####'):
-                # Sub-phase header
-                if self.current_section == 'tasks' and current_phase:
-                    current_subphase = self._parse_subphase(line, current_phase)
-                    current_taskgroup = None  # Reset task group
-            elif line.startswith('#####'):
-                # Task group header
-                if self.current_section == 'tasks' and current_subphase:
-                    current_taskgroup = self._parse_taskgroup(line, current_subphase)
-            elif line.startswith('- [ ]') and self.current_section == 'tasks':
-                # Embedded milestone in tasks section
-                self._parse_embedded_milestone(line, current_phase, current_subphase, current_taskgroup)
-            elif line.startswith('- '):
-                # Task, resource, or milestone line
-                if self.current_section == 'resources':
-                    self._parse_resource(line)
-                elif self.current_section == 'tasks':
-                    parent = current_taskgroup if current_taskgroup else (current_subphase if current_subphase else current_phase)
-                    self._parse_task(line, parent)
-                elif self.current_section == 'milestones':
-                    self._parse_milestone(line)
-            elif line.strip().startswith('- ') and self.current_section == 'tasks':
-                # Subtask properties (indented)
-                self._parse_task_property(line)
-        
+        if content and not content.isspace():  # Blank content has no lines to act on
+            self._parse_lines(_iter_lines(content))
+        return self._finish_project(content)
+    
+    def _parse_lines(self, lines: Iterable[str]):
+        """Dispatch each markdown line to its handler"""
+        state = _HierarchyState()
+        line_res = _LINE_RES
+        handlers = self._LINE_HANDLERS
+        on_property = handlers['property']
+
+        # Stakeholders created for resource lines are saved in one write
+        with self.stakeholder_manager.batch():
+            for line in lines:
+                if not line or line.isspace():
+                    continue  # Blank, tested without building a stripped copy
+                line_match = line_res.get(line[0])
+                if line_match is None:
+                    if line[0].isspace():
+                        # Can only be a task property, which the handler checks for
+                        on_property(self, line, state)
+                    continue  # Prose
+
+                match = line_match(line)
+                if match is not None:
+                    handlers[match.lastgroup](self, line, state)
+    
+    def _finish_project(self, content: str) -> Project:
+        """Resolve dependencies, schedule tasks and import stakeholders"""
         # Resolve all pending dependencies
         self._resolve_dependencies()
         
@@ -99,30 +199,109 @@ class MarkdownParser:
         
         return self.project
     
+    # Line handlers for _parse_lines(), keyed by the _LINE_RES group that matched
+    # ('property' for any line starting with whitespace)
+
+    def _on_project(self, line: str, state: _HierarchyState):
+        self._parse_project_header(line)
+
+    def _on_start_date(self, line: str, state: _HierarchyState):
+        self._parse_start_date(line)
+
+    def _on_duration(self, line: str, state: _HierarchyState):
+        self._parse_duration(line)
+
+    def _on_resources(self, line: str, state: _HierarchyState):
+        self.current_section = 'resources'
+
+    def _on_tasks(self, line: str, state: _HierarchyState):
+        self.current_section = 'tasks'
+
+    def _on_milestones(self, line: str, state: _HierarchyState):
+        self.current_section = 'milestones'
+
+    def _on_header(self, line: str, state: _HierarchyState):
+        if self.current_section != 'tasks':
+            return
+        depth = len(line) - len(line.lstrip('#'))
+        if depth == 3:
+            # Phase header
+            state.phase = self._parse_phase(line)
+            state.subphase = None  # Reset subphase
+            state.taskgroup = None  # Reset task group
+        elif depth == 4:
+            # Sub-phase header
+            if state.phase:
+                state.subphase = self._parse_subphase(line, state.phase)
+                state.taskgroup = None  # Reset task group
+        elif state.subphase:
+            # Task group header (the deepest level; also '######' and below)
+            state.taskgroup = self._parse_taskgroup(line, state.subphase)
+
+    def _on_checkbox(self, line: str, state: _HierarchyState):
+        if self.current_section == 'tasks':
+            # Embedded milestone in tasks section
+            self._parse_embedded_milestone(line, state.phase, state.subphase, state.taskgroup)
+        else:
+            self._on_item(line, state)
+
+    def _on_item(self, line: str, state: _HierarchyState):
+        # Task, resource, or milestone line
+        if self.current_section == 'resources':
+            self._parse_resource(line)
+        elif self.current_section == 'tasks':
+            self._parse_task(line, state.taskgroup or state.subphase or state.phase)
+        elif self.current_section == 'milestones':
+            self._parse_milestone(line)
+
+    def _on_property(self, line: str, state: _HierarchyState):
+        # Subtask properties (indented)
+        if self.current_section == 'tasks':
+            self._parse_task_property(line)
+
+    _LINE_HANDLERS = {
+        'project': _on_project,
+        'start_date': _on_start_date,
+        'duration': _on_duration,
+        'resources': _on_resources,
+        'tasks': _on_tasks,
+        'milestones': _on_milestones,
+        'header': _on_header,
+        'checkbox': _on_checkbox,
+        'item': _on_item,
+        'property': _on_property,
+    }
+
     def _parse_project_header(self, line: str):
         """Parse project name from header"""
-        match = re.search(r'# Project:\s*(.+)', line)
-        if match:
-            project_name = match.group(1).strip()
+        _, marker, project_name = line.partition('# Project:')
+        if marker and project_name:
             self.project = Project(
-                name=project_name,
-                start_date=datetime.now()  # Default, will be updated
+                name=project_name.strip(),
+                start_date=date.today()  # Default, will be updated
             )
+            self._tasks_by_id = {}
     
     def _parse_start_date(self, line: str):
         """Parse start date"""
-        match = re.search(r'\*\*Start Date:\*\*\s*(\d{4}-\d{2}-\d{2})', line)
-        if match and self.project:
-            date_str = match.group(1)
-            self.project.start_date = datetime.strptime(date_str, '%Y-%m-%d')
+        _, marker, rest = line.partition('**Start Date:**')
+        date_str = rest.lstrip()[:10]
+        if (marker and self.project and len(date_str) == 10
+                and date_str[4] == '-' and date_str[7] == '-'
+                and (date_str[:4] + date_str[5:7] + date_str[8:]).isdecimal()):
+            self.project.start_date = _parse_ymd(date_str)
     
     def _parse_duration(self, line: str):
         """Parse project duration"""
-        match = re.search(r'\*\*Duration:\*\*\s*(\d+)\s*(weeks?|days?)', line)
-        if match and self.project:
-            duration = int(match.group(1))
-            unit = match.group(2)
-            if 'week' in unit:
+        _, marker, rest = line.partition('**Duration:**')
+        rest = rest.lstrip()
+        digits = 0
+        while digits < len(rest) and rest[digits].isdecimal():
+            digits += 1
+        unit = rest[digits:].lstrip()
+        if marker and digits and self.project and unit.startswith(('week', 'day')):
+            duration = int(rest[:digits])
+            if unit.startswith('week'):
                 self.project.duration_weeks = duration
                 self.project.duration_days = duration * 7
             else:
@@ -131,10 +310,10 @@ class MarkdownParser:
     def _parse_resource(self, line: str):
         """Parse resource from markdown line"""
         # Format: - Name (Role)
-        match = re.match(r'^-\s*([^(]+?)\s*(?:\(([^)]+)\))?', line.strip())
+        match = _RESOURCE_RE.match(line.strip())
         if match:
             name = match.group(1).strip()
-            role = match.group(2).strip() if match.group(2) else ""
+            role = sys.intern(match.group(2).strip()) if match.group(2) else ""
             
             # Get or create stakeholder
             stakeholder = self.stakeholder_manager.find_or_create(name=name, role=role)
@@ -161,7 +340,8 @@ class MarkdownParser:
         )
         
         self.project.add_task(phase)
-        self.task_name_to_id[phase_name] = self.task_counter
+        self._register_task(phase, None)
+        self.task_name_to_id[sys.intern(phase_name)] = self.task_counter
         self.task_counter += 1
         
         return phase
@@ -179,7 +359,8 @@ class MarkdownParser:
         )
         
         parent_phase.add_subtask(subphase)
-        self.task_name_to_id[subphase_name] = self.task_counter
+        self._register_task(subphase, parent_phase)
+        self.task_name_to_id[sys.intern(subphase_name)] = self.task_counter
         self.task_counter += 1
         
         return subphase
@@ -197,25 +378,37 @@ class MarkdownParser:
         )
         
         parent_subphase.add_subtask(taskgroup)
-        self.task_name_to_id[taskgroup_name] = self.task_counter
+        self._register_task(taskgroup, parent_subphase)
+        self.task_name_to_id[sys.intern(taskgroup_name)] = self.task_counter
         self.task_counter += 1
         
         return taskgroup
     
+    def _extract_milestone(self, line: str) -> Optional[Tuple[str, date]]:
+        """Return the name and date of a milestone line, or None if it isn't one
+
+        Format: - [ ] Milestone Name (YYYY-MM-DD). A missing or malformed
+        date falls back to the project start date.
+        """
+        match = _MILESTONE_RE.match(line.strip())
+        if not match:
+            return None
+        milestone_name = match.group(1).strip()
+        date_str = match.group(2).strip() if match.group(2) else None
+        
+        milestone_date = self.project.start_date
+        if date_str:
+            try:
+                milestone_date = _parse_ymd(date_str)
+            except ValueError:
+                pass
+        return milestone_name, milestone_date
+    
     def _parse_embedded_milestone(self, line: str, current_phase: Optional[Task], current_subphase: Optional[Task], current_taskgroup: Optional[Task] = None):
         """Parse milestone embedded within task section"""
-        # Format: - [ ] Milestone Name (YYYY-MM-DD)
-        match = re.match(r'^-\s*\[\s*\]\s*([^(]+)\s*(?:\(([^)]+)\))?', line.strip())
-        if match:
-            milestone_name = match.group(1).strip()
-            date_str = match.group(2).strip() if match.group(2) else None
-            
-            milestone_date = self.project.start_date
-            if date_str:
-                try:
-                    milestone_date = datetime.strptime(date_str, '%Y-%m-%d')
-                except ValueError:
-                    pass
+        parsed = self._extract_milestone(line)
+        if parsed:
+            milestone_name, milestone_date = parsed
             
             # Create milestone as a task with meeting=true and duration=0
             milestone_task = Task(
@@ -236,6 +429,8 @@ class MarkdownParser:
                 current_phase.add_subtask(milestone_task)
             else:
                 self.project.add_task(milestone_task)
+            self._register_task(milestone_task,
+                                current_taskgroup or current_subphase or current_phase)
             
             # Also add as milestone to project for counting
             milestone = Milestone(
@@ -244,14 +439,18 @@ class MarkdownParser:
                 date=milestone_date
             )
             self.project.add_milestone(milestone)
+            # Shares the task's ID; lookups only resolve here if the task is orphaned
+            self._register_task(milestone, None)
             
-            self.task_name_to_id[milestone_name] = self.task_counter
+            self.task_name_to_id[sys.intern(milestone_name)] = self.task_counter
             self.task_counter += 1
     
     def _parse_task(self, line: str, current_phase: Optional[Task]):
         """Parse task from markdown line"""
         # Format: - **Task Name** (duration days, Resource Name)
-        match = re.match(r'^-\s*\*\*([^*]+)\*\*\s*(?:\(([^)]+)\))?', line.strip())
+        if '**' not in line:
+            return  # Plain bullet, without the regex
+        match = _TASK_RE.match(line.strip())
         if not match:
             return
         
@@ -264,30 +463,36 @@ class MarkdownParser:
         
         if details:
             # Try to parse "X days, ResourceName" format
-            parts = [p.strip() for p in details.split(',')]
-            for part in parts:
-                # Check for duration
-                duration_match = re.search(r'(\d+)\s*days?', part)
-                if duration_match:
-                    duration = int(duration_match.group(1))
-                else:
-                    # Assume it's a resource name if no duration pattern
-                    if not duration_match and part and not part.isdigit():
-                        resource_name = part
+            for part in details.split(','):
+                part = part.strip()
+                # Check for duration: the plain "5 days" by partition(), other
+                # spellings (e.g. "5days", "about 5 days") by the regex
+                if 'day' in part:
+                    count, _, unit = part.partition(' ')
+                    if count.isdecimal() and unit.startswith('day'):
+                        duration = int(count)
+                        continue
+                    duration_match = _DAYS_RE.search(part)
+                    if duration_match:
+                        duration = int(duration_match.group(1))
+                        continue
+                # Assume it's a resource name if no duration pattern
+                if part and not part.isdigit():
+                    resource_name = part
         
         # Find resource ID
         resource_id = None
         if resource_name:
-            for resource in self.project.resources:
-                if resource.name == resource_name:
-                    resource_id = resource.id
-                    break
+            resource = self.project.find_resource_by_name(resource_name)
+            if resource is not None:
+                resource_id = resource.id
         
         task = Task(
             id=self.task_counter,
             name=task_name,
             duration=duration,
-            resource_ids=[resource_id] if resource_id is not None else []
+            # Left unset without a resource, so the empty array is only built if read
+            resource_ids=array('i', (resource_id,)) if resource_id is not None else None
         )
         
         # Add to phase if we're in one
@@ -295,21 +500,25 @@ class MarkdownParser:
             current_phase.add_subtask(task)
         else:
             self.project.add_task(task)
+        self._register_task(task, current_phase)
         
-        self.task_name_to_id[task_name] = self.task_counter
+        self.task_name_to_id[sys.intern(task_name)] = self.task_counter
         self.task_counter += 1
         
         return task
     
     def _parse_task_property(self, line: str):
         """Parse task properties like start date, dependencies, priority"""
-        line = line.strip()
+        line = line.lstrip()  # Trailing whitespace is stripped from the value below
         
         # Skip if not a property line
         if not line.startswith('- '):
             return
         
-        property_line = line[2:].strip()  # Remove "- "
+        key, sep, value = line[2:].partition(':')  # Remove "- "
+        handler = self._PROPERTY_HANDLERS.get(key.lstrip()) if sep else None
+        if handler is None:
+            return
         
         # Get the last task created (this property belongs to it)
         if self.task_counter == 0:
@@ -320,78 +529,65 @@ class MarkdownParser:
         if not last_task:
             return
         
-        # Parse different property types
-        if property_line.startswith('Start:'):
-            self._parse_start_property(property_line, last_task)
-        elif property_line.startswith('Dependencies:'):
-            self._parse_dependencies_property(property_line, last_task)
-        elif property_line.startswith('Priority:'):
-            self._parse_priority_property(property_line, last_task)
-        elif property_line.startswith('Progress:'):
-            self._parse_progress_property(property_line, last_task)
+        handler(self, value.strip(), last_task)
     
-    def _parse_start_property(self, property_line: str, task: Task):
+    def _parse_start_property(self, start_value: str, task: Task):
         """Parse start date property"""
-        start_value = property_line.replace('Start:', '').strip()
-        
         # Check for absolute date
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', start_value)
+        date_match = _DATE_RE.search(start_value)
         if date_match:
-            task.start_date = datetime.strptime(date_match.group(1), '%Y-%m-%d')
+            task.start_date = _parse_ymd(date_match.group(1))
             return
         
-        # Check for "After TaskName" format
-        after_match = re.search(r'After\s+(.+)', start_value, re.IGNORECASE)
-        if after_match:
-            prerequisite_name = after_match.group(1).strip()
+        # Check for "After TaskName" format; the usual leading form is
+        # checked by hand, the regex also finds it mid-value
+        prerequisite_name = None
+        if start_value[:5].lower() == 'after' and start_value[5:6].isspace():
+            prerequisite_name = start_value[6:].strip() or None
+        if prerequisite_name is None:
+            after_match = _AFTER_RE.search(start_value)
+            if after_match:
+                prerequisite_name = after_match.group(1).strip()
+        if prerequisite_name is not None:
+            prerequisite_name = sys.intern(prerequisite_name)
             # Store for later resolution
             self.pending_dependencies.append((task.id, prerequisite_name, DependencyType.FINISH_TO_START))
     
-    def _parse_dependencies_property(self, property_line: str, task: Task):
+    def _parse_dependencies_property(self, deps_value: str, task: Task):
         """Parse dependencies property"""
-        deps_value = property_line.replace('Dependencies:', '').strip()
-        
         # Split by commas and process each dependency
         for dep_name in deps_value.split(','):
             dep_name = dep_name.strip()
             if dep_name:
-                self.pending_dependencies.append((task.id, dep_name, DependencyType.FINISH_TO_START))
+                # Interned like the task_name_to_id keys, so lookups compare by identity
+                self.pending_dependencies.append((task.id, sys.intern(dep_name), DependencyType.FINISH_TO_START))
     
-    def _parse_priority_property(self, property_line: str, task: Task):
+    def _parse_priority_property(self, priority_value: str, task: Task):
         """Parse priority property"""
-        priority_value = property_line.replace('Priority:', '').strip().lower()
-        
-        priority_map = {
-            'low': TaskPriority.LOW,
-            'medium': None,  # Normal priority = no attribute in XML
-            'normal': None,
-            'high': TaskPriority.HIGH,
-            'highest': TaskPriority.HIGHEST,
-            'critical': TaskPriority.HIGHEST
-        }
-
-        task.priority = priority_map.get(priority_value, None)
+        if priority_value in _PRIORITY_MAP:
+            task.priority = _PRIORITY_MAP[priority_value]
+        else:
+            task.priority = _PRIORITY_MAP.get(priority_value.lower())
     
-    def _parse_progress_property(self, property_line: str, task: Task):
+    def _parse_progress_property(self, progress_value: str, task: Task):
         """Parse progress property"""
-        progress_match = re.search(r'(\d+)%?', property_line.replace('Progress:', '').strip())
+        progress_match = _PROGRESS_RE.search(progress_value)
         if progress_match:
             task.progress = int(progress_match.group(1))
+
+    # Task property handlers, keyed by the text before the property's first ':'
+    _PROPERTY_HANDLERS = {
+        'Start': _parse_start_property,
+        'Dependencies': _parse_dependencies_property,
+        'Priority': _parse_priority_property,
+        'Progress': _parse_progress_property,
+    }
     
     def _parse_milestone(self, line: str):
         """Parse milestone from markdown line"""
-        # Format: - [ ] Milestone Name (YYYY-MM-DD)
-        match = re.match(r'^-\s*\[\s*\]\s*([^(]+)\s*(?:\(([^)]+)\))?', line.strip())
-        if match:
-            milestone_name = match.group(1).strip()
-            date_str = match.group(2).strip() if match.group(2) else None
-            
-            milestone_date = self.project.start_date
-            if date_str:
-                try:
-                    milestone_date = datetime.strptime(date_str, '%Y-%m-%d')
-                except ValueError:
-                    pass
+        parsed = self._extract_milestone(line)
+        if parsed:
+            milestone_name, milestone_date = parsed
             
             milestone = Milestone(
                 id=self.task_counter,
@@ -400,103 +596,161 @@ class MarkdownParser:
             )
             
             self.project.add_milestone(milestone)
-            self.task_name_to_id[milestone_name] = self.task_counter
+            self._register_task(milestone, None)
+            self.task_name_to_id[sys.intern(milestone_name)] = self.task_counter
             self.task_counter += 1
     
+    def _register_task(self, task: Task, parent: Optional[Task]):
+        """Index a new task by ID if it belongs to the current project
+
+        A parent left over from before a second '# Project:' header is not
+        part of the current project, and neither are its new subtasks. The
+        first task indexed under an ID wins, matching project order.
+        """
+        if parent is None or self._tasks_by_id.get(parent.id) is parent:
+            self._tasks_by_id.setdefault(task.id, task)
+
     def _find_task_by_id(self, task_id: int) -> Optional[Task]:
         """Find a task by ID in the project"""
-        all_tasks = self.project.get_all_tasks()
-        for task in all_tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks_by_id.get(task_id)
     
     def _resolve_dependencies(self):
         """Resolve all pending dependencies"""
+        tasks_by_id = self._tasks_by_id
+        task_name_to_id = self.task_name_to_id
+
+        # First pass: exact name matches, collecting the names left over
+        resolved = []
+        unmatched: Dict[str, None] = {}  # Insertion-ordered set
         for task_id, dep_name, dep_type in self.pending_dependencies:
-            task = self._find_task_by_id(task_id)
+            task = tasks_by_id.get(task_id)
             if not task:
                 continue
-            
-            # Find the dependency task - try exact match first
-            dep_task_id = self.task_name_to_id.get(dep_name)
+            dep_task_id = task_name_to_id.get(dep_name)
             if dep_task_id is None:
-                # Try partial matching for short names
-                for full_name, full_id in self.task_name_to_id.items():
-                    if dep_name in full_name or full_name.endswith(dep_name):
-                        dep_task_id = full_id
-                        break
-            
-            if dep_task_id is not None:
-                # Check if this dependency already exists to avoid duplicates
-                already_exists = any(d.successor_id == dep_task_id for d in task.dependencies)
-                if not already_exists:
-                    task.add_dependency(dep_task_id, dep_type)
+                unmatched[dep_name] = None
+            resolved.append((task, dep_name, dep_task_id, dep_type))
+
+        # Second pass: partial matches for the leftover names, all at once
+        partial_matches = self._match_partial_names(unmatched) if unmatched else {}
+
+        existing: Dict[int, set] = {}  # task ID -> successor IDs it already has
+        for task, dep_name, dep_task_id, dep_type in resolved:
+            if dep_task_id is None:
+                dep_task_id = partial_matches.get(dep_name)
+                if dep_task_id is None:
+                    continue
+
+            # Check if this dependency already exists to avoid duplicates
+            successor_ids = existing.get(task.id)
+            if successor_ids is None:
+                successor_ids = existing[task.id] = {d.successor_id for d in task.dependencies}
+            if dep_task_id not in successor_ids:
+                task.add_dependency(dep_task_id, dep_type)
+                successor_ids.add(dep_task_id)
+
+    def _match_partial_names(self, dep_names: Iterable[str]) -> Dict[str, int]:
+        """Map each dependency name to the first task name, in insertion order, containing it
+
+        Names without a match are left out. All task names are joined by NUL
+        and searched with one str.find() per dependency name; the match is
+        mapped back to a name by its start offset.
+        """
+        task_name_to_id = self.task_name_to_id
+        names = list(task_name_to_id)
+        if not names:
+            return {}
+        name_offsets = []
+        offset = 0
+        for name in names:
+            name_offsets.append(offset)
+            offset += len(name) + 1
+        all_names = '\0'.join(names)
+
+        matches = {}
+        for dep_name in dep_names:
+            if '\0' in dep_name:
+                dep_task_id = next((full_id for full_name, full_id in task_name_to_id.items()
+                                    if dep_name in full_name), None)
+                if dep_task_id is not None:
+                    matches[dep_name] = dep_task_id
+                continue
+            position = all_names.find(dep_name)
+            if position >= 0:
+                matches[dep_name] = task_name_to_id[names[bisect_right(name_offsets, position) - 1]]
+        return matches
     
     def _calculate_dates(self):
-        """Calculate start and end dates for all tasks based on dependencies"""
+        """Calculate start and end dates for all tasks based on dependencies
+
+        Tasks are dated in topological order (Kahn's algorithm), each once
+        all the task IDs it depends on are scheduled. Tasks caught in or
+        behind a dependency cycle fall back to the project start date.
+        The work runs in the _schedule kernel over flat arrays of ordinals.
+        """
         if not self.project:
             return
+        from ._schedule import schedule
         
-        # Get all tasks and sort by dependencies (topological sort)
         all_tasks = self.project.get_all_tasks()
-        scheduled_tasks = set()
+        tasks_by_id = self._tasks_by_id
+        position = {id(task): i for i, task in enumerate(all_tasks)}
+        ends = array('l', (task.end_date.toordinal() if task.end_date else 0 for task in all_tasks))
         
-        # First pass: schedule tasks without dependencies
+        # Dense index per task ID, shared by tasks with the same ID and also
+        # given to IDs that are only ever depended on
+        dense_ids: Dict[int, int] = {}
+        id_idx = array('i', (dense_ids.setdefault(task.id, len(dense_ids)) for task in all_tasks))
+        
+        dep_ptr, pred_pos, dep_fs = array('i', [0]), array('i'), array('b')
+        wait_ptr, wait_ids = array('i', [0]), array('i')
         for task in all_tasks:
-            if not task.dependencies:
-                if task.start_date is None:
-                    task.start_date = self.project.start_date
-                task.calculate_dates(task.start_date)
-                scheduled_tasks.add(task.id)
-        
-        # Keep scheduling dependent tasks until all are done
-        max_iterations = len(all_tasks) * 2  # Prevent infinite loops
-        iteration = 0
-        
-        while len(scheduled_tasks) < len(all_tasks) and iteration < max_iterations:
-            iteration += 1
-            progress_made = False
-            
-            for task in all_tasks:
-                if task.id in scheduled_tasks:
-                    continue
-                
-                # Check if all dependencies are scheduled
-                all_deps_ready = True
-                latest_end_date = self.project.start_date
-                
+            if task.dependencies:
+                waiting_for = set()
                 for dep in task.dependencies:
-                    if dep.to_task_id not in scheduled_tasks:
-                        all_deps_ready = False
-                        break
+                    pred = tasks_by_id.get(dep.to_task_id)
+                    if pred is None:
+                        pred_pos.append(-1)
+                    elif id(pred) in position:
+                        pred_pos.append(position[id(pred)])
+                    else:
+                        # Outside the project: only its end date is read
+                        position[id(pred)] = len(ends)
+                        pred_pos.append(len(ends))
+                        ends.append(pred.end_date.toordinal() if pred.end_date else 0)
+                    dep_fs.append(dep.type == DependencyType.FINISH_TO_START)
                     
-                    # Find the dependency task and get its end date
-                    dep_task = self._find_task_by_id(dep.to_task_id)
-                    if dep_task and dep_task.end_date:
-                        # For FINISH_TO_START dependencies, start after predecessor ends
-                        if dep.type == DependencyType.FINISH_TO_START:
-                            candidate_start = dep_task.end_date + timedelta(days=1)
-                            if candidate_start > latest_end_date:
-                                latest_end_date = candidate_start
-                
-                if all_deps_ready:
-                    # Schedule this task
-                    if task.start_date is None:
-                        task.start_date = latest_end_date
-                    task.calculate_dates(task.start_date)
-                    scheduled_tasks.add(task.id)
-                    progress_made = True
-            
-            if not progress_made:
-                # Handle remaining tasks without dependencies
-                for task in all_tasks:
-                    if task.id not in scheduled_tasks:
-                        if task.start_date is None:
-                            task.start_date = self.project.start_date
-                        task.calculate_dates(task.start_date)
-                        scheduled_tasks.add(task.id)
-                break
+                    dense = dense_ids.setdefault(dep.to_task_id, len(dense_ids))
+                    if dense not in waiting_for:
+                        waiting_for.add(dense)
+                        wait_ids.append(dense)
+            dep_ptr.append(len(pred_pos))
+            wait_ptr.append(len(wait_ids))
+        
+        # Invert the waits: tasks waiting on each dense ID
+        waiter_ptr = array('i', [0]) * (len(dense_ids) + 1)
+        for dense in wait_ids:
+            waiter_ptr[dense + 1] += 1
+        for k in range(len(dense_ids)):
+            waiter_ptr[k + 1] += waiter_ptr[k]
+        waiters = array('i', [0]) * len(wait_ids)
+        fill = waiter_ptr[:len(dense_ids)]
+        for i in range(len(all_tasks)):
+            for dense in wait_ids[wait_ptr[i]:wait_ptr[i + 1]]:
+                waiters[fill[dense]] = i
+                fill[dense] += 1
+        
+        starts = array('l', (task.start_date.toordinal() if task.start_date else 0 for task in all_tasks))
+        computed = array('b', [0]) * len(all_tasks)
+        schedule(self.project.start_date.toordinal(),
+                 array('l', (task.duration for task in all_tasks)),
+                 starts, ends, computed, id_idx,
+                 dep_ptr, pred_pos, dep_fs, wait_ptr, wait_ids, waiter_ptr, waiters)
+        
+        for i, task in enumerate(all_tasks):
+            if computed[i]:
+                task.start_date = date.fromordinal(starts[i])
+                task.end_date = date.fromordinal(ends[i])
 
 
 class ProjectAnalyzer:
@@ -519,7 +773,7 @@ class ProjectAnalyzer:
             analysis = analyzer.analyze_package(project_path)
             return analyzer.generate_gantt_project(
                 analysis, 
-                datetime.now(),
+                date.today(),
                 team_size=3
             )
         elif project_type == "markdown":
@@ -549,7 +803,7 @@ class ProjectAnalyzer:
         """Create a basic project structure for unknown types"""
         project = Project(
             name=f"{project_path.name} Project",
-            start_date=datetime.now(),
+            start_date=date.today(),
             description=f"Generic project for {project_path.name}"
         )
         
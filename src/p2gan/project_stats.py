@@ -19,18 +19,115 @@ Options:
     --all             Include all files (default skips common ignore patterns)
 """
 
+from array import array
+import heapq
+import mmap
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Optional, Union
 import argparse
 import re
 
 
+# ASCII bytes str.isspace() accepts besides the line breaks '\r' and '\n'
+_ASCII_WHITESPACE = b' \t\x0b\x0c\x1c\x1d\x1e\x1f'
+
+# A file's contents: mapped rather than read once over ProjectStats.LARGE_FILE_SIZE
+_Contents = Union[bytes, mmap.mmap]
+
+
+def _decode_text(data: bytes) -> str:
+    """data as a text-mode open() reads it: invalid UTF-8 dropped, universal newlines"""
+    text = data.decode('utf-8', errors='ignore')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _file_ext(name: str) -> str:
+    """Lower-cased extension of a file name, as Path(name).suffix.lower()
+
+    Unlike os.path.splitext(), a name ending in '.' has no extension and
+    neither does a name whose only dot is its first character.
+    """
+    i = name.rfind('.')
+    return name[i:].lower() if 0 < i < len(name) - 1 else ''
+
+
+# A regex source that only matches itself literally: plain or escaped non-alphanumeric characters
+_LITERAL_SOURCE_RE = re.compile(r'(?:\\[^A-Za-z0-9]|[^.^$*+?{}\[\]|()\\])+')
+
+
+def _regex_literal(source: str) -> Optional[str]:
+    """The text a regex source matches, if it is a plain literal"""
+    if not _LITERAL_SOURCE_RE.fullmatch(source):
+        return None
+    return re.sub(r'\\(.)', r'\1', source)
+
+
+# An extension's comment patterns, arranged by _comment_rules(): the leading
+# anchored literals as a tuple of prefixes, whether each starts a multi-line
+# comment, and the other patterns as (literal or regex, is a regex, starts a
+# multi-line comment)
+_CommentRules = Tuple[Tuple[str, ...], Tuple[bool, ...], List[Tuple[Any, bool, bool]]]
+
+
+def _comment_rules(patterns: List[Tuple['re.Pattern', str]]) -> _CommentRules:
+    """Arrange an extension's comment patterns for ProjectStats._count_comment_text()
+
+    Patterns that are a literal, optionally after '^\\s*', are tested with
+    startswith() or 'in' on the line; any other pattern is searched as is.
+    The leading run of anchored literals is tested at once with a tuple of
+    prefixes before telling them apart.
+    """
+    prefixes: List[str] = []
+    prefix_starts: List[bool] = []
+    others: List[Tuple[Any, bool, bool]] = []
+    for pattern, comment_type in patterns:
+        source = pattern.pattern
+        starts_multiline = comment_type == 'multi_start'
+        literal = None
+        if pattern.flags == re.UNICODE:
+            literal = _regex_literal(source[len('^\\s*'):] if source.startswith('^\\s*') else source)
+        if literal is not None and source.startswith('^\\s*') and not others:
+            prefixes.append(literal)
+            prefix_starts.append(starts_multiline)
+        elif literal is not None and not source.startswith('^'):
+            others.append((literal, False, starts_multiline))
+        else:
+            others.append((pattern, True, starts_multiline))
+    return tuple(prefixes), tuple(prefix_starts), others
+
+
 class ProjectStats:
     """Generate comprehensive project statistics"""
 
+    # Extensions of files that are likely text, and have their lines counted
+    TEXT_EXTENSIONS = frozenset({
+        '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.c', '.cpp', '.h', '.hpp',
+        '.go', '.rs', '.rb', '.php', '.pl', '.sh', '.bash', '.zsh',
+        '.html', '.css', '.scss', '.sass', '.less',
+        '.xml', '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg',
+        '.md', '.txt', '.rst', '.adoc',
+        '.sql', '.r', '.m', '.swift', '.kt', '.scala',
+    })
+
+    # Directories skipped unless skip_common_dirs is False
+    IGNORE_DIRS = frozenset({
+        '.git', '__pycache__', 'node_modules', '.pytest_cache',
+        'venv', '.venv', '.tox', 'dist', 'build', '.egg-info',
+        '.mypy_cache', '.coverage', 'htmlcov', '.eggs'
+    })
+
+    # Files handed to a read-ahead thread at a time
+    READ_BATCH = 64
+
+    # Files larger than this are memory-mapped and counted in chunks of about this size
+    LARGE_FILE_SIZE = 1 << 20
+
     # Comment patterns for different languages
     COMMENT_PATTERNS = {
         '.py': [
@@ -81,9 +178,40 @@ class ProjectStats:
         ],
     }
 
-    def __init__(self, project_path: str, skip_common_dirs: bool = True):
+    # Substrings that end a multi-line comment
+    MULTILINE_END_TOKENS = {
+        '.py': ('"""', "'''"),
+        '.js': ('*/',),
+        '.ts': ('*/',),
+        '.java': ('*/',),
+        '.c': ('*/',),
+        '.cpp': ('*/',),
+        '.go': ('*/',),
+        '.rs': ('*/',),
+    }
+
+    def __init__(self, project_path: str, skip_common_dirs: bool = True,
+                 max_workers: Optional[int] = None):
         self.project_path = Path(project_path).resolve()
         self.skip_common_dirs = skip_common_dirs
+        # Length of the project path plus separator, to slice off entry paths
+        self._root_len = len(os.path.join(str(self.project_path), ''))
+        # Threads reading text files ahead of the line counting
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        # Extension -> COMMENT_PATTERNS entries, as _comment_rules()
+        self._comment_rules = {ext: _comment_rules(patterns) for ext, patterns in self.COMMENT_PATTERNS.items()}
+        # Extension -> flags for the compiled ASCII line scanner, if numba is installed
+        try:
+            from ._line_scan import count_ascii_lines, syntax_flags
+        except ImportError:  # Run as a standalone script
+            count_ascii_lines = None
+        self._count_ascii_lines = count_ascii_lines
+        self._ascii_syntax = {}
+        if count_ascii_lines is not None:
+            for ext, patterns in self.COMMENT_PATTERNS.items():
+                syntax = syntax_flags(patterns, self.MULTILINE_END_TOKENS.get(ext, ()))
+                if syntax is not None:
+                    self._ascii_syntax[ext] = syntax
 
         # Overall stats
         self.total_files = 0
@@ -136,195 +264,361 @@ class ProjectStats:
         self.fixme_count = 0
         self.hack_count = 0
 
-        # File tracking
-        self.largest_files = []  # (size, path) tuples
-        self.most_lines = []     # (lines, path) tuples
+        # File tracking, as parallel arrays (for print_top_files())
+        self.file_paths: List[str] = []  # Relative paths, one per file
+        self.file_sizes = array('q')     # Size of file_paths[i]
+        self.line_files = array('q')     # Text files, as indexes into file_paths
+        self.line_counts = array('q')    # Lines in file_paths[line_files[j]]
 
     def analyze(self):
-        """Walk directory and collect statistics"""
+        """Walk directory and collect statistics
+
+        Directories are listed with os.scandir() in the same order as
+        os.walk() (top-down, without following directory symlinks), so each
+        file's stat() can come from its DirEntry. Text files are read by a
+        thread pool a few files ahead of the line counting, which stays on
+        this thread and sees files in walk order.
+        """
         print(f"📊 Analyzing project: {self.project_path}")
         print("="*70)
 
-        for root, dirs, files in os.walk(self.project_path):
-            # Skip common ignore patterns
-            if self.skip_common_dirs:
-                dirs[:] = [d for d in dirs if d not in {
-                    '.git', '__pycache__', 'node_modules', '.pytest_cache',
-                    'venv', '.venv', '.tox', 'dist', 'build', '.egg-info',
-                    '.mypy_cache', '.coverage', 'htmlcov', '.eggs'
-                }]
-
-            root_path = Path(root)
-
-            for file in files:
-                file_path = root_path / file
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for entry, ext, data in self._read_ahead(pool, self._iter_files()):
                 try:
-                    self._analyze_file(file_path)
+                    self._analyze_file(entry, ext, data)
                 except Exception as e:
-                    print(f"⚠ Error processing {file_path}: {e}")
+                    print(f"⚠ Error processing {entry.path}: {e}")
 
         print(f"✓ Analyzed {self.total_files} files")
         print(f"✓ Total size: {self._format_size(self.total_size)}")
         print(f"✓ Total lines: {self.total_lines:,}\n")
 
-    def _analyze_file(self, file_path: Path):
-        """Analyze a single file"""
-        stat = file_path.stat()
-        size = stat.st_size
+    def _iter_files(self) -> Iterator[os.DirEntry]:
+        """Yield the non-directory entries under the project, in os.walk() order"""
+        stack = [str(self.project_path)]
+        while stack:
+            entries = self._scan_dir(stack.pop())
+            if entries is None:
+                continue
+            dirs, files = entries
 
-        # Get top-level subdirectory
-        relative = file_path.relative_to(self.project_path)
-        parts = relative.parts
-        top_dir = parts[0] if len(parts) > 1 else '.'
+            # Skip common ignore patterns
+            if self.skip_common_dirs:
+                dirs = [d for d in dirs if d.name not in self.IGNORE_DIRS]
+
+            yield from files
+
+            # Depth-first, visiting subdirectories in listing order
+            stack.extend(d.path for d in reversed(dirs) if not d.is_symlink())
+
+    def _read_ahead(self, pool: ThreadPoolExecutor, entries: Iterator[os.DirEntry]
+                    ) -> Iterator[Tuple[os.DirEntry, str, Optional[_Contents]]]:
+        """Yield (entry, extension, contents), reading text files in the pool
+
+        Entries are handed to the pool in batches of READ_BATCH, with at
+        most two batches per worker in flight. The contents are None for
+        other files and for text files that can't be read.
+        """
+        pending = deque()
+        batch = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) == self.READ_BATCH:
+                pending.append(pool.submit(self._read_batch, batch))
+                batch = []
+                if len(pending) > 2 * self.max_workers:
+                    yield from pending.popleft().result()
+        if batch:
+            pending.append(pool.submit(self._read_batch, batch))
+        while pending:
+            yield from pending.popleft().result()
+
+    def _read_batch(self, entries: List[os.DirEntry]) -> List[Tuple[os.DirEntry, str, Optional[_Contents]]]:
+        results = []
+        for entry in entries:
+            ext = _file_ext(entry.name)
+            data = None
+            if ext in self.TEXT_EXTENSIONS:
+                try:
+                    size = entry.stat().st_size
+                    if size > self.LARGE_FILE_SIZE:
+                        with open(entry.path, 'rb') as f:
+                            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    else:
+                        data = self._read_small_file(entry.path, size)
+                except Exception:
+                    pass  # Line counting is skipped for unreadable files
+            results.append((entry, ext, data))
+        return results
+
+    @staticmethod
+    def _read_small_file(path: str, size: int) -> bytes:
+        """Read a file expected to hold size bytes
+
+        Unbuffered, so it usually takes just open, read and close system
+        calls. open().read() also queries the file's size and position.
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            data = os.read(fd, size + 1)
+            if len(data) != size:  # Changed since it was listed
+                parts = [data]
+                while data:
+                    data = os.read(fd, 1 << 16)
+                    parts.append(data)
+                data = b''.join(parts)
+            return data
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _scan_dir(path: str) -> Optional[Tuple[List[os.DirEntry], List[os.DirEntry]]]:
+        """List a directory as (subdirectories, other entries), or None if it can't be read"""
+        dirs = []
+        files = []
+        try:
+            with os.scandir(path) as scandir_it:
+                for entry in scandir_it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (dirs if is_dir else files).append(entry)
+        except OSError:
+            return None  # Unreadable directories are skipped, as by os.walk()
+        return dirs, files
+
+    def _analyze_file(self, entry: os.DirEntry, ext: str, data: Optional[_Contents]):
+        """Analyze a single file, given its extension and, if it is a readable text file, contents"""
+        size = entry.stat().st_size
 
-        # Get file extension
-        ext = file_path.suffix.lower()
+        # Get top-level subdirectory
+        relative_str = entry.path[self._root_len:]
+        sep = relative_str.find(os.sep)
+        top_dir = relative_str[:sep] if sep >= 0 else '.'
 
         # Check if this is a notes/transcript file
-        relative_str = str(relative)
         is_notes_transcript = relative_str.startswith('docs/notes/') and ext == '.md'
 
         # Update counts
         self.total_files += 1
         self.total_size += size
-        self.stats_by_subdir[top_dir]['files'] += 1
-        self.stats_by_subdir[top_dir]['size'] += size
+        subdir_stats = self.stats_by_subdir[top_dir]
+        subdir_stats['files'] += 1
+        subdir_stats['size'] += size
 
         # Handle .md files specially
         if ext == '.md':
             if is_notes_transcript:
-                self.notes_transcripts_stats['files'] += 1
-                self.notes_transcripts_stats['size'] += size
+                category_stats = self.notes_transcripts_stats
             else:
-                self.documentation_stats['files'] += 1
-                self.documentation_stats['size'] += size
+                category_stats = self.documentation_stats
         else:
             # Regular file type tracking
-            self.stats_by_type[ext]['files'] += 1
-            self.stats_by_type[ext]['size'] += size
+            category_stats = self.stats_by_type[ext]
+        category_stats['files'] += 1
+        category_stats['size'] += size
 
         # Track largest files
-        self.largest_files.append((size, file_path))
+        file_index = len(self.file_paths)
+        self.file_paths.append(relative_str)
+        self.file_sizes.append(size)
 
         # Count lines for text files
-        if self._is_text_file(file_path):
-            lines, code, comments, blanks, todos, fixmes, hacks = self._count_lines(file_path, ext)
+        if ext in self.TEXT_EXTENSIONS:
+            lines, code, comments, blanks, todos, fixmes, hacks = self._count_lines(data, ext)
 
             self.total_lines += lines
 
-            self.stats_by_subdir[top_dir]['lines'] += lines
-            self.stats_by_subdir[top_dir]['code'] += code
-            self.stats_by_subdir[top_dir]['comments'] += comments
-            self.stats_by_subdir[top_dir]['blanks'] += blanks
+            subdir_stats['lines'] += lines
+            subdir_stats['code'] += code
+            subdir_stats['comments'] += comments
+            subdir_stats['blanks'] += blanks
 
             # Route .md files to documentation categories (NOT source code)
             if ext == '.md':
                 if is_notes_transcript:
                     self.notes_transcripts_lines += lines
-                    self.notes_transcripts_stats['lines'] += lines
                 else:
                     self.documentation_lines += lines
-                    self.documentation_stats['lines'] += lines
+                category_stats['lines'] += lines
             else:
                 # Source code files - add to source totals
                 self.source_code_lines += code
                 self.source_comment_lines += comments
                 self.source_blank_lines += blanks
 
-                self.stats_by_type[ext]['lines'] += lines
-                self.stats_by_type[ext]['code'] += code
-                self.stats_by_type[ext]['comments'] += comments
-                self.stats_by_type[ext]['blanks'] += blanks
+                category_stats['lines'] += lines
+                category_stats['code'] += code
+                category_stats['comments'] += comments
+                category_stats['blanks'] += blanks
 
             self.todo_count += todos
             self.fixme_count += fixmes
             self.hack_count += hacks
 
-            self.most_lines.append((lines, file_path))
-
-    def _is_text_file(self, file_path: Path) -> bool:
-        """Check if file is likely a text file"""
-        text_extensions = {
-            '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.c', '.cpp', '.h', '.hpp',
-            '.go', '.rs', '.rb', '.php', '.pl', '.sh', '.bash', '.zsh',
-            '.html', '.css', '.scss', '.sass', '.less',
-            '.xml', '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg',
-            '.md', '.txt', '.rst', '.adoc',
-            '.sql', '.r', '.m', '.swift', '.kt', '.scala',
-        }
-        return file_path.suffix.lower() in text_extensions
-
-    def _count_lines(self, file_path: Path, ext: str) -> Tuple[int, int, int, int, int, int, int]:
-        """Count lines, code, comments, blanks for a file"""
-        total_lines = 0
-        code_lines = 0
-        comment_lines = 0
-        blank_lines = 0
-        todo_count = 0
-        fixme_count = 0
-        hack_count = 0
-
-        in_multiline_comment = False
+            self.line_files.append(file_index)
+            self.line_counts.append(lines)
 
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    total_lines += 1
-                    stripped = line.strip()
-
-                    # Check for special markers (in any line)
-                    if 'TODO' in line.upper():
-                        todo_count += 1
-                    if 'FIXME' in line.upper():
-                        fixme_count += 1
-                    if 'HACK' in line.upper():
-                        hack_count += 1
-
-                    # Blank line
-                    if not stripped:
-                        blank_lines += 1
-                        continue
+    def _count_lines(self, data: Optional[_Contents], ext: str) -> Tuple[int, int, int, int, int, int, int]:
+        """Count lines, code, comments, blanks in a file's contents (None if unreadable)
 
-                    # Check for comments
-                    is_comment = False
-
-                    # Handle multi-line comments
-                    if in_multiline_comment:
-                        comment_lines += 1
-                        if self._is_multiline_end(stripped, ext):
+        ASCII files whose comment syntax the compiled scanner knows are
+        counted by it. Otherwise mapped contents are handled a chunk of
+        whole lines at a time, so a large file is never copied into memory
+        at once.
+        """
+        if data is None:
+            # If we can't read it, just skip line counting
+            return 0, 0, 0, 0, 0, 0, 0
+        syntax = self._ascii_syntax.get(ext)
+        if isinstance(data, mmap.mmap):
+            with data:
+                counts = self._count_ascii_lines(data, syntax) if syntax is not None else None
+                if counts is None:
+                    counts = self._count_chunks(self._line_chunks(data), ext)
+                return counts
+        if syntax is not None:
+            counts = self._count_ascii_lines(data, syntax)
+            if counts is not None:
+                return counts
+        return self._count_chunks((data,), ext)
+
+    def _line_chunks(self, data: mmap.mmap) -> Iterator[bytes]:
+        """Split mapped contents into pieces of about LARGE_FILE_SIZE that end in '\\n'"""
+        size = len(data)
+        start = 0
+        while start < size:
+            end = data.rfind(b'\n', start, start + self.LARGE_FILE_SIZE) + 1
+            if end <= start:  # A line longer than a chunk
+                end = data.find(b'\n', start + self.LARGE_FILE_SIZE) + 1 or size
+            yield data[start:end]
+            start = end
+
+    def _count_chunks(self, chunks: Iterable[bytes], ext: str) -> Tuple[int, int, int, int, int, int, int]:
+        """Count lines in contents given as consecutive chunks of whole lines"""
+        rules = self._comment_rules.get(ext)
+        if rules is not None:
+            # Comments can span chunks, so their lines are counted in one pass
+            return self._count_comment_text(map(_decode_text, chunks), rules,
+                                            self.MULTILINE_END_TOKENS.get(ext, ()))
+
+        # Without comment syntax, ASCII chunks are counted on the raw bytes
+        totals = [0] * 7
+        for chunk in chunks:
+            if chunk.isascii():
+                counts = self._count_plain_lines(chunk)
+            else:
+                counts = self._count_plain_text(_decode_text(chunk))
+            for i, count in enumerate(counts):
+                totals[i] += count
+        return tuple(totals)
+
+    @staticmethod
+    def _count_comment_text(texts: Iterable[str], rules: _CommentRules,
+                            end_tokens: Tuple[str, ...]) -> Tuple[int, int, int, int, int, int, int]:
+        """_count_lines() for decoded text given as consecutive chunks of whole lines
+
+        The first comment rule that matches a line makes it a comment; a
+        line in a multi-line comment is one until a line containing one of
+        end_tokens.
+        """
+        prefixes, prefix_starts, others = rules
+        total_lines = code_lines = comment_lines = blank_lines = 0
+        todo_count = fixme_count = hack_count = 0
+        in_multiline_comment = False
+        for text in texts:
+            lines = text.split('\n')
+            if not lines[-1]:
+                lines.pop()  # Nothing follows the last line break
+            total_lines += len(lines)
+            todos, fixmes, hacks = ProjectStats._count_marker_lines(text.upper(), ('TODO', 'FIXME', 'HACK'), '\n')
+            todo_count += todos
+            fixme_count += fixmes
+            hack_count += hacks
+
+            for line in lines:
+                if not line or line.isspace():
+                    blank_lines += 1
+                    continue
+                if in_multiline_comment:
+                    comment_lines += 1
+                    for token in end_tokens:
+                        if token in line:
                             in_multiline_comment = False
-                        continue
-
-                    # Check for comment start
-                    if ext in self.COMMENT_PATTERNS:
-                        for pattern, comment_type in self.COMMENT_PATTERNS[ext]:
-                            if pattern.search(line):
-                                is_comment = True
-                                if comment_type == 'multi_start':
-                                    in_multiline_comment = True
-                                    # Check if it also ends on same line
-                                    if self._is_multiline_end(line, ext):
-                                        in_multiline_comment = False
-                                break
-
-                    if is_comment:
-                        comment_lines += 1
+                            break
+                    continue
+
+                # Check for comment start
+                stripped = line.lstrip()
+                if prefixes and stripped.startswith(prefixes):
+                    for prefix, starts_multiline in zip(prefixes, prefix_starts):
+                        if stripped.startswith(prefix):
+                            break
+                else:
+                    for test, is_regex, starts_multiline in others:
+                        if test.search(line) if is_regex else test in line:
+                            break
                     else:
                         code_lines += 1
+                        continue
 
-        except Exception as e:
-            # If we can't read it, just skip line counting
-            pass
-
+                comment_lines += 1
+                if starts_multiline:
+                    # Check if it also ends on same line
+                    in_multiline_comment = True
+                    for token in end_tokens:
+                        if token in line:
+                            in_multiline_comment = False
+                            break
         return total_lines, code_lines, comment_lines, blank_lines, todo_count, fixme_count, hack_count
 
-    def _is_multiline_end(self, line: str, ext: str) -> bool:
-        """Check if line ends a multi-line comment"""
-        if ext == '.py':
-            return '"""' in line or "'''" in line
-        elif ext in {'.js', '.ts', '.java', '.c', '.cpp', '.go', '.rs'}:
-            return '*/' in line
-        return False
+    @staticmethod
+    def _count_plain_lines(data: bytes) -> Tuple[int, int, int, int, int, int, int]:
+        """_count_lines() for ASCII data without comment syntax, using bytes methods
+
+        Line breaks are the '\n', '\r\n' and '\r' of universal newlines, and
+        every non-blank line is code.
+        """
+        if not data:
+            return 0, 0, 0, 0, 0, 0, 0
+        text = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+        # Blank lines are the ones left empty once whitespace is deleted
+        bare_lines = text.translate(None, _ASCII_WHITESPACE).split(b'\n')
+        if text.endswith(b'\n'):
+            bare_lines.pop()  # Nothing follows the last line break
+        total_lines = len(bare_lines)
+        blank_lines = bare_lines.count(b'')
+
+        markers = ProjectStats._count_marker_lines(text.upper(), (b'TODO', b'FIXME', b'HACK'), b'\n')
+        return (total_lines, total_lines - blank_lines, 0, blank_lines, *markers)
+
+    @staticmethod
+    def _count_plain_text(text: str) -> Tuple[int, int, int, int, int, int, int]:
+        """_count_plain_lines() for decoded text"""
+        lines = text.split('\n')
+        if not lines[-1]:
+            lines.pop()  # Nothing follows the last line break
+        total_lines = len(lines)
+        blank_lines = lines.count('') + sum(map(str.isspace, lines))
+
+        markers = ProjectStats._count_marker_lines(text.upper(), ('TODO', 'FIXME', 'HACK'), '\n')
+        return (total_lines, total_lines - blank_lines, 0, blank_lines, *markers)
+
+    @staticmethod
+    def _count_marker_lines(upper, markers: tuple, newline) -> List[int]:
+        """How many lines of upper-cased text (str or bytes) contain each marker"""
+        upper_lines = None
+        counts = []
+        for marker in markers:
+            count = 0
+            if marker in upper:
+                if upper_lines is None:
+                    upper_lines = upper.split(newline)
+                count = sum(1 for line in upper_lines if marker in line)
+            counts.append(count)
+        return counts
 
     def _format_size(self, size: int) -> str:
         """Format file size in human-readable format"""
@@ -430,20 +724,33 @@ class ProjectStats:
         print(f"TOP {n} LARGEST FILES")
         print("="*70)
 
-        largest = sorted(self.largest_files, reverse=True)[:n]
-        for size, path in largest:
-            rel_path = path.relative_to(self.project_path)
+        largest = self._top_files(n, self.file_sizes, range(len(self.file_paths)))
+        for size, rel_path in largest:
             print(f"{self._format_size(size):>10} - {rel_path}")
 
         print("\n" + "="*70)
         print(f"TOP {n} FILES BY LINE COUNT")
         print("="*70)
 
-        most_lines = sorted(self.most_lines, reverse=True)[:n]
-        for lines, path in most_lines:
-            rel_path = path.relative_to(self.project_path)
+        most_lines = self._top_files(n, self.line_counts, self.line_files)
+        for lines, rel_path in most_lines:
             print(f"{lines:>8,} lines - {rel_path}")
 
+    def _top_files(self, n: int, values: array, indexes: Sequence[int]) -> List[Tuple[int, Path]]:
+        """The n largest (value, relative path) pairs, largest first
+
+        values[j] belongs to file_paths[indexes[j]]. Equal values are ordered
+        by path, descending, as when sorting (value, Path) tuples.
+        """
+        top_values = heapq.nlargest(n, values)
+        if not top_values:
+            return []
+        threshold = top_values[-1]
+        paths = self.file_paths
+        candidates = [(value, Path(paths[index]))
+                      for value, index in zip(values, indexes) if value >= threshold]
+        return heapq.nlargest(n, candidates)
+
     def _percent(self, part: int, total: int) -> str:
         """Calculate percentage string"""
         if total == 0:
@@ -451,8 +758,16 @@ class ProjectStats:
         return f"{(part / total * 100):.1f}%"
 
     def export_json(self, output_file: str):
-        """Export statistics as JSON"""
+        """Export statistics as JSON
+
+        Uses orjson when it is installed and its output is the same as
+        json.dump()'s, i.e. when nothing needs escaping to ASCII.
+        """
         import json
+        try:
+            import orjson
+        except ImportError:  # orjson is an optional speed-up
+            orjson = None
 
         data = {
             'project_path': str(self.project_path),
@@ -471,12 +786,24 @@ class ProjectStats:
             },
             'documentation': self.documentation_stats,
             'notes_transcripts': self.notes_transcripts_stats,
-            'by_subdir': dict(self.stats_by_subdir),
-            'by_type': dict(self.stats_by_type),
+            'by_subdir': self.stats_by_subdir,
+            'by_type': self.stats_by_type,
         }
 
+        text = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                pass  # Names that aren't valid UTF-8
+            else:
+                if payload.isascii() and b'\x7f' not in payload:
+                    text = payload.decode('ascii')
+        if text is None:
+            text = json.dumps(data, indent=2)
+
         with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(text)
 
         print(f"\n✅ JSON exported to: {output_file}")
 
@@ -518,6 +845,8 @@ class ProjectStats:
 | Directory | Files | Lines | Code | Comments |
 |-----------|-------|-------|------|----------|
 """
+        parts = [report]
+
         # Add subdirectory stats
         sorted_dirs = sorted(
             self.stats_by_subdir.items(),
@@ -526,20 +855,20 @@ class ProjectStats:
         )
 
         for dir_name, stats in sorted_dirs:
-            report += f"| {dir_name} | {stats['files']:,} | {stats['lines']:,} | {stats['code']:,} | {stats['comments']:,} |\n"
+            parts.append(f"| {dir_name} | {stats['files']:,} | {stats['lines']:,} | {stats['code']:,} | {stats['comments']:,} |\n")
 
-        report += "\n## By File Type\n\n"
-        report += "| Type | Files | Lines | Code | Comments |\n"
-        report += "|------|-------|-------|------|----------|\n"
+        parts.append("\n## By File Type\n\n")
+        parts.append("| Type | Files | Lines | Code | Comments |\n")
+        parts.append("|------|-------|-------|------|----------|\n")
 
         # Add documentation categories first (no code/comment breakdown)
         if self.documentation_stats['files'] > 0:
-            report += (f"| Documentation (.md) | {self.documentation_stats['files']:,} | "
-                      f"{self.documentation_stats['lines']:,} | ─ | ─ |\n")
+            parts.append(f"| Documentation (.md) | {self.documentation_stats['files']:,} | "
+                         f"{self.documentation_stats['lines']:,} | ─ | ─ |\n")
 
         if self.notes_transcripts_stats['files'] > 0:
-            report += (f"| Notes/Trans | {self.notes_transcripts_stats['files']:,} | "
-                      f"{self.notes_transcripts_stats['lines']:,} | ─ | ─ |\n")
+            parts.append(f"| Notes/Trans | {self.notes_transcripts_stats['files']:,} | "
+                         f"{self.notes_transcripts_stats['lines']:,} | ─ | ─ |\n")
 
         # Add other file types
         if self.stats_by_type:
@@ -551,10 +880,10 @@ class ProjectStats:
 
             for ext, stats in sorted_types[:20]:
                 ext_display = ext if ext else '(no ext)'
-                report += f"| {ext_display} | {stats['files']:,} | {stats['lines']:,} | {stats['code']:,} | {stats['comments']:,} |\n"
+                parts.append(f"| {ext_display} | {stats['files']:,} | {stats['lines']:,} | {stats['code']:,} | {stats['comments']:,} |\n")
 
         with open(output_file, 'w') as f:
-            f.write(report)
+            f.writelines(parts)
 
         print(f"✅ Markdown report exported to: {output_file}")
 
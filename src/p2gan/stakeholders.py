@@ -2,16 +2,114 @@
 Stakeholder management system for project resource allocation
 """
 
+import heapq
 import json
 import os
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field, asdict
+import re
+from contextlib import contextmanager
+from typing import ClassVar, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+_RESOURCES_SECTION_RE = re.compile(r'## Resources\s*\n((?:- .*\n?)*)', re.MULTILINE)
+_RESOURCE_LINE_RE = re.compile(r'^- ([^(]+)\s*(?:\(([^)]+)\))?')
+# Output where orjson may differ from json: an exponent (json writes 1e+16
+# and 1e-07 where orjson writes 1e16 and 1e-7), a float below 1e-4 (json
+# writes 5e-05 where orjson writes 0.00005) or a null (orjson's NaN and
+# infinities). Matches inside strings too, which only costs a json.dumps()
+_ORJSON_DIFFERS_RE = re.compile(rb'[0-9]e|0\.0000|null')
+
+
+def _loads(payload: bytes):
+    """Parse JSON, with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # Let json report it, or read what it accepts beyond the spec (NaN)
+    return json.loads(payload)
+
+
+def _dumps(data) -> bytes:
+    """Serialize to indented UTF-8 JSON, with orjson when it is installed
+
+    Both ways write the same bytes. json writes what orjson would write
+    differently (floats with an exponent, NaN and infinities) or not at all
+    (names that aren't valid UTF-8, integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if not _ORJSON_DIFFERS_RE.search(payload):
+                return payload
+    try:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    except UnicodeEncodeError:  # Lone surrogates, which only an escape can write
+        return json.dumps(data, indent=2).encode('ascii')
+
+
+class _AliasList(list):
+    """A stakeholder's aliases, counting changes made in place in Stakeholder.names_version"""
+    
+    def append(self, alias):
+        super().append(alias)
+        Stakeholder.names_version += 1
+    
+    def extend(self, aliases):
+        super().extend(aliases)
+        Stakeholder.names_version += 1
+    
+    def insert(self, position, alias):
+        super().insert(position, alias)
+        Stakeholder.names_version += 1
+    
+    def remove(self, alias):
+        super().remove(alias)
+        Stakeholder.names_version += 1
+    
+    def pop(self, *position):
+        alias = super().pop(*position)
+        Stakeholder.names_version += 1
+        return alias
+    
+    def clear(self):
+        super().clear()
+        Stakeholder.names_version += 1
+    
+    def __setitem__(self, position, alias):
+        super().__setitem__(position, alias)
+        Stakeholder.names_version += 1
+    
+    def __delitem__(self, position):
+        super().__delitem__(position)
+        Stakeholder.names_version += 1
+    
+    def __iadd__(self, aliases):
+        result = super().__iadd__(aliases)
+        Stakeholder.names_version += 1
+        return result
+    
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        Stakeholder.names_version += 1
+        return result
+
 
 @dataclass
 class Stakeholder:
     """Represents a project stakeholder who can be assigned to tasks"""
+    # Changes whenever the name or aliases of any stakeholder change after it
+    # was created, so a StakeholderManager knows its alias index is out of date
+    names_version: ClassVar[int] = 0
+    
     name: str
     role: str
     email: str = ""
@@ -24,18 +122,62 @@ class Stakeholder:
     projects: Set[str] = field(default_factory=set)  # Projects involved in
     aliases: List[str] = field(default_factory=list)  # Alternative names
     
+    def __setattr__(self, attr: str, value):
+        """Keep aliases in an _AliasList and count name and alias changes
+        
+        __init__ sets aliases last, so changes are counted once it is set.
+        """
+        if attr != 'name' and attr != 'aliases':
+            object.__setattr__(self, attr, value)
+            return
+        created = 'aliases' in self.__dict__
+        if attr == 'aliases' and not isinstance(value, _AliasList):
+            value = _AliasList(value)
+        object.__setattr__(self, attr, value)
+        if created:
+            Stakeholder.names_version += 1
+    
     def matches_name(self, name: str) -> bool:
         """Check if a name matches this stakeholder"""
-        name_lower = name.lower()
-        if name_lower == self.name.lower():
-            return True
-        return any(alias.lower() == name_lower for alias in self.aliases)
+        return name.lower() in self.names_lower
+    
+    @property
+    def names_lower(self) -> FrozenSet[str]:
+        """Lower-cased name and aliases, recomputed only when they change"""
+        cached = getattr(self, '_names_lower', None)
+        if cached is None or cached[0] != self.name or cached[1] != self.aliases:
+            names = frozenset([self.name.lower(), *(alias.lower() for alias in self.aliases)])
+            cached = (self.name, list(self.aliases), names)
+            self._names_lower = cached
+        return cached[2]
+    
+    @property
+    def skills_lower(self) -> FrozenSet[str]:
+        """Lower-cased skills, recomputed only when the skills list changes"""
+        cached = getattr(self, '_skills_lower', None)
+        if cached is None or cached[0] != self.skills:
+            cached = (list(self.skills), frozenset(skill.lower() for skill in self.skills))
+            self._skills_lower = cached
+        return cached[1]
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization"""
-        data = asdict(self)
-        data['projects'] = list(self.projects)  # Convert set to list
-        return data
+        """Convert to dictionary for serialization
+
+        Built field by field: asdict() would deep-copy every value.
+        """
+        return {
+            'name': self.name,
+            'role': self.role,
+            'email': self.email,
+            'phone': self.phone,
+            'department': self.department,
+            'skills': list(self.skills),
+            'availability': self.availability,
+            'standard_rate': self.standard_rate,
+            'overtime_rate': self.overtime_rate,
+            'projects': list(self.projects),  # Convert set to list
+            'aliases': list(self.aliases),
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Stakeholder':
@@ -44,6 +186,34 @@ class Stakeholder:
         return cls(**data)
 
 
+class _FieldIndex:
+    """Cache positions of the stakeholders by project, role, department and skill
+
+    Groups list positions in keys, the stakeholder keys in cache order;
+    skills are lower-cased.
+    """
+    
+    def __init__(self, stakeholders: Dict[str, Stakeholder]):
+        self.keys: List[str] = []
+        self.by_project: Dict[str, List[int]] = {}
+        self.by_role: Dict[str, List[int]] = {}
+        self.by_department: Dict[str, List[int]] = {}
+        self.by_skill: Dict[str, List[int]] = {}
+        for key, stakeholder in stakeholders.items():
+            self.add(key, stakeholder)
+    
+    def add(self, key: str, stakeholder: Stakeholder):
+        """Index a stakeholder appended to the cache"""
+        position = len(self.keys)
+        self.keys.append(key)
+        for project in stakeholder.projects:
+            self.by_project.setdefault(project, []).append(position)
+        self.by_role.setdefault(stakeholder.role, []).append(position)
+        self.by_department.setdefault(stakeholder.department, []).append(position)
+        for skill in stakeholder.skills_lower:
+            self.by_skill.setdefault(skill, []).append(position)
+
+
 class StakeholderManager:
     """Manages a cache of stakeholders across projects"""
     
@@ -52,49 +222,166 @@ class StakeholderManager:
     def __init__(self, cache_path: Optional[Path] = None):
         """Initialize stakeholder manager with optional custom cache path"""
         self.cache_path = cache_path or self.DEFAULT_CACHE_PATH
-        self.stakeholders: Dict[str, Stakeholder] = {}
-        self.load_cache()
+        self._stakeholders: Optional[Dict[str, Stakeholder]] = None  # Until load_cache()
+        self._batch_depth = 0  # Nesting of batch() blocks
+        self._dirty = False  # Whether a save_cache() was deferred by batch()
+        # Lower-cased name or alias -> key of the first stakeholder it matches, built on demand
+        self._name_index: Optional[Dict[str, str]] = None
+        # Stakeholder.names_version and the number of stakeholders the index was built for
+        self._name_index_state: Tuple[int, int] = (-1, -1)
+        # Stakeholders by project, role, department and skill, built on demand
+        self._field_index: Optional[_FieldIndex] = None
+    
+    @property
+    def stakeholders(self) -> Dict[str, Stakeholder]:
+        """Stakeholders by name, loaded from the cache on first access"""
+        if self._stakeholders is None:
+            self.load_cache()
+        return self._stakeholders
+    
+    @stakeholders.setter
+    def stakeholders(self, stakeholders: Dict[str, Stakeholder]):
+        self._stakeholders = stakeholders
+        self._name_index = None
+        self._field_index = None
     
     def load_cache(self):
         """Load stakeholder cache from disk"""
+        if self._stakeholders is None:
+            self._stakeholders = {}
         if self.cache_path.exists():
             try:
-                with open(self.cache_path, 'r') as f:
-                    data = json.load(f)
-                    for name, stakeholder_data in data.items():
-                        self.stakeholders[name] = Stakeholder.from_dict(stakeholder_data)
+                with open(self.cache_path, 'rb') as f:
+                    data = _loads(f.read())
+                for name, stakeholder_data in data.items():
+                    self._stakeholders[name] = Stakeholder.from_dict(stakeholder_data)
             except (json.JSONDecodeError, KeyError) as e:
                 print(f"Warning: Could not load stakeholder cache: {e}")
-                self.stakeholders = {}
+                self._stakeholders = {}
+            self._name_index = None
+            self._field_index = None
         else:
             # Create directory if it doesn't exist
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
     
     def save_cache(self):
-        """Save stakeholder cache to disk"""
+        """Save stakeholder cache to disk
+
+        Inside batch() the write is deferred to the end of the outermost
+        block. The project/role/department/skill index is rebuilt on next
+        use, so changes made to stakeholders directly show up in it too.
+        """
+        self._field_index = None
+        self._save()
+    
+    def _save(self):
+        """Write the cache, or defer it to the end of the outermost batch()"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._write_cache()
+    
+    def flush(self):
+        """Write a save deferred by batch(), if any"""
+        if self._dirty:
+            self._write_cache()
+    
+    @contextmanager
+    def batch(self) -> Iterator['StakeholderManager']:
+        """Turn the saves of a block of changes into a single write"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
+    def _write_cache(self):
+        """Write every stakeholder to the cache file
+
+        The file is replaced as a whole, so a crash while writing leaves the
+        previous cache in place rather than a truncated one.
+        """
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
         data = {name: s.to_dict() for name, s in self.stakeholders.items()}
-        with open(self.cache_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = _dumps(data)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
     
     def add_stakeholder(self, stakeholder: Stakeholder) -> Stakeholder:
         """Add or update a stakeholder in the cache"""
+        if stakeholder.name in self.stakeholders:
+            # The replaced one's aliases and fields may differ
+            self._name_index = None
+            self._field_index = None
+        else:
+            if self._name_index is not None and self._name_index_state == self._names_state():
+                self._index_names(self._name_index, stakeholder.name, stakeholder)
+                self._name_index_state = (Stakeholder.names_version,
+                                          len(self.stakeholders) + 1)
+            if self._field_index is not None:
+                self._field_index.add(stakeholder.name, stakeholder)
         self.stakeholders[stakeholder.name] = stakeholder
-        self.save_cache()
+        self._save()
         return stakeholder
     
     def get_stakeholder(self, name: str) -> Optional[Stakeholder]:
         """Get a stakeholder by name or alias"""
         # Direct lookup
-        if name in self.stakeholders:
-            return self.stakeholders[name]
+        stakeholder = self.stakeholders.get(name)
+        if stakeholder is not None:
+            return stakeholder
         
-        # Search by alias
-        for stakeholder in self.stakeholders.values():
-            if stakeholder.matches_name(name):
-                return stakeholder
+        # Search by alias, case-insensitively
+        key = self._find_alias(name.lower())
+        return self.stakeholders[key] if key is not None else None
+    
+    def _find_key(self, name: str) -> Optional[str]:
+        """Key of the stakeholder get_stakeholder() returns for name"""
+        if name in self.stakeholders:
+            return name
+        return self._find_alias(name.lower())
+
+    def _find_alias(self, name: str) -> Optional[str]:
+        """Key of the first stakeholder matching the lower-cased name, or None"""
+        return self._lookup_names().get(name)
+    
+    def _names_state(self) -> Tuple[int, int]:
+        """What the alias index goes out of date with, besides add_stakeholder()"""
+        return Stakeholder.names_version, len(self.stakeholders)
+    
+    def _lookup_names(self) -> Dict[str, str]:
+        """The alias index, rebuilt if a name or alias changed since it was built
         
-        return None
+        Stakeholders added to the dict directly rather than through
+        add_stakeholder() change its length, which rebuilds the index too.
+        """
+        index = self._name_index
+        state = self._names_state()
+        if index is None or self._name_index_state != state:
+            index = {}
+            for key, stakeholder in self.stakeholders.items():
+                self._index_names(index, key, stakeholder)
+            self._name_index = index
+            self._name_index_state = state
+        return index
+    
+    @staticmethod
+    def _index_names(index: Dict[str, str], key: str, stakeholder: Stakeholder):
+        """Map the stakeholder's names to key, unless an earlier one matches them"""
+        for name in stakeholder.names_lower:
+            index.setdefault(name, key)
     
     def find_or_create(self, name: str, role: str = "", **kwargs) -> Stakeholder:
         """Find existing stakeholder or create new one"""
@@ -107,17 +394,39 @@ class StakeholderManager:
     def list_stakeholders(self, project: Optional[str] = None, 
                          role: Optional[str] = None,
                          department: Optional[str] = None) -> List[Stakeholder]:
-        """List stakeholders with optional filters"""
-        results = list(self.stakeholders.values())
+        """List stakeholders with optional filters
+
+        Only the smallest of the indexed groups asked for is checked against
+        the filters. Like the alias index, it follows changes made through
+        the manager, and save_cache() after direct ones.
+        """
+        stakeholders = self.stakeholders
+        if not (project or role or department):
+            return list(stakeholders.values())
         
+        index = self._lookup_fields()
+        groups = []
         if project:
-            results = [s for s in results if project in s.projects]
+            groups.append(index.by_project.get(project, ()))
         if role:
-            results = [s for s in results if s.role == role]
+            groups.append(index.by_role.get(role, ()))
         if department:
-            results = [s for s in results if s.department == department]
+            groups.append(index.by_department.get(department, ()))
         
-        return results
+        keys = index.keys
+        candidates = (stakeholders.get(keys[position]) for position in min(groups, key=len))
+        return [s for s in candidates
+                if s is not None
+                and (not project or project in s.projects)
+                and (not role or s.role == role)
+                and (not department or s.department == department)]
+    
+    def _lookup_fields(self) -> '_FieldIndex':
+        """The project, role, department and skill index, built if needed"""
+        index = self._field_index
+        if index is None:
+            index = self._field_index = _FieldIndex(self.stakeholders)
+        return index
     
     def get_available_stakeholders(self, min_availability: float = 0.5) -> List[Stakeholder]:
         """Get stakeholders with sufficient availability"""
@@ -126,71 +435,82 @@ class StakeholderManager:
     
     def assign_to_project(self, stakeholder_name: str, project_name: str):
         """Assign a stakeholder to a project"""
-        stakeholder = self.get_stakeholder(stakeholder_name)
-        if stakeholder:
-            stakeholder.projects.add(project_name)
-            self.save_cache()
+        key = self._find_key(stakeholder_name)
+        if key is not None:
+            self.stakeholders[key].projects.add(project_name)
+            self._field_index = None
+            self._save()
     
     def import_from_markdown(self, markdown_content: str, project_name: str):
         """Import stakeholders from markdown resource section"""
-        import re
-        
         # Look for Resources section
-        resources_section = re.search(
-            r'## Resources\s*\n((?:- .*\n?)*)',
-            markdown_content,
-            re.MULTILINE
-        )
+        resources_section = _RESOURCES_SECTION_RE.search(markdown_content)
         
         if resources_section:
             resources_text = resources_section.group(1)
             
             # Parse each resource line: - Name (Role)
-            for line in resources_text.split('\n'):
-                match = re.match(r'^- ([^(]+)\s*(?:\(([^)]+)\))?', line.strip())
-                if match:
-                    name = match.group(1).strip()
-                    role = match.group(2).strip() if match.group(2) else ""
-                    
-                    stakeholder = self.find_or_create(name=name, role=role)
-                    stakeholder.projects.add(project_name)
-            
-            self.save_cache()
+            with self.batch():
+                for line in resources_text.split('\n'):
+                    match = _RESOURCE_LINE_RE.match(line.strip())
+                    if match:
+                        name = match.group(1).strip()
+                        role = match.group(2).strip() if match.group(2) else ""
+                        
+                        stakeholder = self.find_or_create(name=name, role=role)
+                        if project_name not in stakeholder.projects:
+                            stakeholder.projects.add(project_name)
+                            self._field_index = None
+                
+                self._save()
     
     def suggest_team(self, required_skills: List[str], 
                      team_size: int = 5) -> List[Stakeholder]:
-        """Suggest a team based on required skills"""
+        """Suggest a team based on required skills
+
+        Only stakeholders indexed with one of the skills are scored, in cache order.
+        """
         scored_stakeholders = []
+        # Lower-cased required skill -> how many times it is required
+        required: Dict[str, int] = {}
+        for skill in required_skills:
+            skill = skill.lower()
+            required[skill] = required.get(skill, 0) + 1
+        
+        stakeholders = self.stakeholders
+        index = self._lookup_fields()
+        positions: Set[int] = set()
+        for skill in required:
+            positions.update(index.by_skill.get(skill, ()))
         
-        for stakeholder in self.stakeholders.values():
-            if stakeholder.availability < 0.2:  # Skip unavailable
+        for position in sorted(positions):
+            stakeholder = stakeholders.get(index.keys[position])
+            if stakeholder is None or stakeholder.availability < 0.2:  # Skip unavailable
                 continue
             
             # Score based on skill match
-            skill_matches = sum(1 for skill in required_skills 
-                              if skill.lower() in [s.lower() for s in stakeholder.skills])
+            skill_matches = sum(required[skill] for skill in required.keys() & stakeholder.skills_lower)
             
             if skill_matches > 0:
                 score = skill_matches * stakeholder.availability
                 scored_stakeholders.append((score, stakeholder))
         
-        # Sort by score and return top N
-        scored_stakeholders.sort(key=lambda x: x[0], reverse=True)
-        return [s for _, s in scored_stakeholders[:team_size]]
+        # Top N by score; like a stable sort, ties keep their cache order
+        return [s for _, s in heapq.nlargest(team_size, scored_stakeholders, key=lambda x: x[0])]
     
     def export_to_csv(self, filepath: str):
         """Export stakeholder list to CSV"""
         import csv
         
-        with open(filepath, 'w', newline='') as f:
+        with open(filepath, 'w', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow([
                 'Name', 'Role', 'Email', 'Phone', 'Department',
                 'Skills', 'Availability', 'Projects'
             ])
             
-            for stakeholder in self.stakeholders.values():
-                writer.writerow([
+            writer.writerows(
+                (
                     stakeholder.name,
                     stakeholder.role,
                     stakeholder.email,
@@ -199,18 +519,33 @@ class StakeholderManager:
                     ', '.join(stakeholder.skills),
                     f"{stakeholder.availability * 100}%",
                     ', '.join(stakeholder.projects)
-                ])
+                )
+                for stakeholder in self.stakeholders.values()
+            )
     
     def merge_with(self, other_manager: 'StakeholderManager'):
-        """Merge another stakeholder manager's data"""
+        """Merge another stakeholder manager's data
+
+        Nothing is saved if the merge changes nothing.
+        """
+        stakeholders = self.stakeholders
+        changed = False
         for name, stakeholder in other_manager.stakeholders.items():
-            if name in self.stakeholders:
+            existing = stakeholders.get(name)
+            if existing is not None:
                 # Merge projects and update other fields if newer
-                self.stakeholders[name].projects.update(stakeholder.projects)
+                before = len(existing.projects)
+                existing.projects.update(stakeholder.projects)
+                if len(existing.projects) != before:
+                    changed = True
             else:
-                self.stakeholders[name] = stakeholder
+                stakeholders[name] = stakeholder
+                changed = True
+                self._name_index = None
         
-        self.save_cache()
+        if changed:
+            self._field_index = None
+            self._save()
 
 
 # Default instance for convenience
@@ -5,20 +5,29 @@ Can be used locally or in CI/CD pipelines.
 """
 
 import sys
-import subprocess
 from pathlib import Path
+from typing import Callable, Optional
 
 
-def run_command(cmd: list[str], description: str) -> bool:
-    """Run a command and return success status."""
+def run_command(cmd: list[str], description: str, step: Callable[[], Optional[int]]) -> bool:
+    """Run a tool's entry point in this process and return success status.
+
+    cmd is the equivalent command line, for display.
+    """
     print(f"\n{'='*60}")
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}")
     print('='*60)
 
-    result = subprocess.run(cmd, capture_output=False)
+    try:
+        returncode = step()
+    except SystemExit as e:  # Entry points that exit instead of returning
+        returncode = e.code
+    except ImportError as e:
+        print(e)
+        returncode = 1
 
-    if result.returncode != 0:
+    if returncode:
         print(f"❌ {description} failed!")
         return False
 
@@ -30,7 +39,7 @@ def main():
     """Run all tests and quality checks."""
 
     # Change to project root
-    project_root = Path(__file__).parent
+    project_root = Path(__file__).resolve().parent.parent
     import os
     os.chdir(project_root)
 
@@ -40,47 +49,65 @@ def main():
 
     all_passed = True
 
-    # 1. Run pytest
-    if not run_command(
-        ["python", "-m", "pytest", "tests/", "-v"],
-        "Unit Tests (pytest)"
-    ):
-        all_passed = False
+    # Each tool runs through its Python entry point, sharing this interpreter
+
+    # 1. Run pytest, with coverage (a single run: addopts already enable --cov)
+    def pytest_step():
+        import pytest
+        return pytest.main(["tests/", "-v", "--cov=p2gan", "--cov-report=term-missing"])
 
-    # 2. Run pytest with coverage
     if not run_command(
-        ["python", "-m", "pytest", "tests/", "--cov=p2gan", "--cov-report=term-missing"],
-        "Test Coverage"
+        ["python", "-m", "pytest", "tests/", "-v", "--cov=p2gan", "--cov-report=term-missing"],
+        "Unit Tests and Coverage (pytest)",
+        pytest_step
     ):
         all_passed = False
 
-    # 3. Check code formatting with black (check only)
+    # 2. Check code formatting with black (check only)
+    def black_step():
+        import black
+        return black.main(["src/p2gan/", "tests/", "--check"], standalone_mode=False)
+
     if not run_command(
         ["python", "-m", "black", "src/p2gan/", "tests/", "--check"],
-        "Code Formatting (black)"
+        "Code Formatting (black)",
+        black_step
     ):
         print("Tip: Run 'black src/p2gan/ tests/' to auto-format")
         all_passed = False
 
-    # 4. Run flake8 linting
+    # 3. Run flake8 linting
+    def flake8_step():
+        from flake8.main import cli
+        return cli.main(["src/p2gan/", "--max-line-length=88", "--exclude=__pycache__"])
+
     if not run_command(
         ["python", "-m", "flake8", "src/p2gan/", "--max-line-length=88", "--exclude=__pycache__"],
-        "Linting (flake8)"
+        "Linting (flake8)",
+        flake8_step
     ):
         all_passed = False
 
-    # 5. Run type checking with mypy (if installed)
+    # 4. Run type checking with mypy (if installed)
     try:
-        import mypy
+        from mypy import api as mypy_api
+    except ImportError:
+        print("\n⚠️  Skipping mypy (not installed)")
+    else:
+        def mypy_step():
+            stdout, stderr, returncode = mypy_api.run(["src/p2gan/", "--ignore-missing-imports"])
+            print(stdout, end='')
+            print(stderr, end='', file=sys.stderr)
+            return returncode
+
         if not run_command(
             ["python", "-m", "mypy", "src/p2gan/", "--ignore-missing-imports"],
-            "Type Checking (mypy)"
+            "Type Checking (mypy)",
+            mypy_step
         ):
             all_passed = False
-    except ImportError:
-        print("\n⚠️  Skipping mypy (not installed)")
 
-    # 6. Check that package can be imported
+    # 5. Check that package can be imported
     print("\n" + "="*60)
     print("Checking package import...")
     try:
@@ -4,91 +4,93 @@ import pytest
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from p2gan.generator import GanttGenerator
-from p2gan.models import Project, Task, Resource, ResourceAllocation, Milestone
+from p2gan.models import Project, Task, Resource, ResourceAllocation, Milestone, DependencyType
 
 
-class TestGanttGenerator:
-    """Test GanttGenerator functionality."""
+@pytest.fixture(scope="class")
+def simple_project():
+    """Create a simple project for testing."""
+    project = Project(
+        name="Test Project",
+        start_date=datetime(2025, 1, 1),
+        company="Test Corp"
+    )
 
-    @pytest.fixture
-    def simple_project(self):
-        """Create a simple project for testing."""
-        project = Project(
-            name="Test Project",
-            start_date=datetime(2025, 1, 1),
-            company="Test Corp"
-        )
+    # Add a resource
+    resource = Resource(id=0, name="Alice", function="Developer")
+    project.add_resource(resource)
 
-        # Add a resource
-        resource = Resource(id=0, name="Alice", role="Developer")
-        project.add_resource(resource)
+    # Add a task
+    task = Task(
+        id=0,
+        name="Development",
+        start_date=datetime(2025, 1, 1),
+        duration=5,
+        progress=50
+    )
+    project.add_task(task)
+    project.allocations.append(ResourceAllocation(task_id=0, resource_id=0, load=100.0))
 
-        # Add a task
-        task = Task(
-            id=0,
-            name="Development",
-            start_date=datetime(2025, 1, 1),
-            duration=5,
-            progress=50
-        )
-        allocation = ResourceAllocation(task_id=0, resource_id=0, load=100.0)
-        task.allocations.append(allocation)
-        project.add_task(task)
+    # Add a milestone
+    milestone = Milestone(
+        id=1,
+        name="Project Complete",
+        date=datetime(2025, 1, 8)
+    )
+    project.add_task(milestone)
 
-        # Add a milestone
-        milestone = Milestone(
-            id=1,
-            name="Project Complete",
-            date=datetime(2025, 1, 8)
-        )
-        project.add_task(milestone)
+    return project
 
-        return project
 
-    def test_generate_xml_structure(self, simple_project):
-        """Test that generated XML has correct structure."""
-        generator = GanttGenerator(simple_project)
-        xml_string = generator.generate_xml()
+@pytest.fixture(scope="class")
+def simple_xml_root(simple_project):
+    """Generate and parse the simple project's XML once for the class."""
+    xml_string = GanttGenerator().generate_xml(simple_project)
+    return ET.fromstring(xml_string)
+
+
+@pytest.fixture(scope="class")
+def simple_tasks_by_name(simple_xml_root):
+    """Index the simple project's task elements by name."""
+    return tasks_by_name(simple_xml_root)
 
-        # Parse the XML to check structure
-        root = ET.fromstring(xml_string)
+
+def tasks_by_name(root):
+    """Map task names to their elements in one walk of the tree."""
+    return {task.get("name"): task for task in root.iter("task")}
+
+
+class TestGanttGenerator:
+    """Test GanttGenerator functionality."""
+
+    def test_generate_xml_structure(self, simple_xml_root):
+        """Test that generated XML has correct structure."""
+        root = simple_xml_root
 
         assert root.tag == "project"
         assert root.get("name") == "Test Project"
-        assert root.get("version") == "3.2.3230"
+        assert root.get("version") == "3.2.3200"
 
-    def test_generate_tasks_section(self, simple_project):
+    def test_generate_tasks_section(self, simple_xml_root):
         """Test tasks section generation."""
-        generator = GanttGenerator(simple_project)
-        xml_string = generator.generate_xml()
-
-        root = ET.fromstring(xml_string)
-        tasks_elem = root.find("tasks")
+        tasks_elem = simple_xml_root.find("tasks")
 
         assert tasks_elem is not None
         task_elements = tasks_elem.findall("task")
         assert len(task_elements) == 2  # 1 task + 1 milestone
 
-    def test_generate_resources_section(self, simple_project):
+    def test_generate_resources_section(self, simple_xml_root):
         """Test resources section generation."""
-        generator = GanttGenerator(simple_project)
-        xml_string = generator.generate_xml()
-
-        root = ET.fromstring(xml_string)
-        resources_elem = root.find("resources")
+        resources_elem = simple_xml_root.find("resources")
 
         assert resources_elem is not None
         resource_elements = resources_elem.findall("resource")
         assert len(resource_elements) == 1
         assert resource_elements[0].get("name") == "Alice"
 
-    def test_generate_allocations_section(self, simple_project):
+    def test_generate_allocations_section(self, simple_xml_root):
         """Test allocations section generation."""
-        generator = GanttGenerator(simple_project)
-        xml_string = generator.generate_xml()
-
-        root = ET.fromstring(xml_string)
-        allocations_elem = root.find("allocations")
+        allocations_elem = simple_xml_root.find("allocations")
 
         assert allocations_elem is not None
         allocation_elements = allocations_elem.findall("allocation")
@@ -98,30 +100,20 @@ class TestGanttGenerator:
 
     def test_save_to_file(self, simple_project, tmp_path):
         """Test saving to file."""
-        generator = GanttGenerator(simple_project)
+        generator = GanttGenerator()
         output_file = tmp_path / "test_output.gan"
 
-        generator.save(str(output_file))
+        generator.save_to_file(simple_project, str(output_file))
 
         assert output_file.exists()
         content = output_file.read_text()
-        assert '<?xml version="1.0" encoding="UTF-8"?>' in content
+        assert content.startswith("<?xml version=\"1.0\"")
         assert '<project' in content
 
-    def test_milestone_generation(self, simple_project):
+    def test_milestone_generation(self, simple_tasks_by_name):
         """Test that milestones are generated correctly."""
-        generator = GanttGenerator(simple_project)
-        xml_string = generator.generate_xml()
-
-        root = ET.fromstring(xml_string)
-        tasks_elem = root.find("tasks")
-        task_elements = tasks_elem.findall("task")
-
         # Find the milestone
-        milestone_elem = next(
-            (t for t in task_elements if t.get("name") == "Project Complete"),
-            None
-        )
+        milestone_elem = simple_tasks_by_name.get("Project Complete")
         assert milestone_elem is not None
         assert milestone_elem.get("duration") == "0"
         assert milestone_elem.get("meeting") == "true"
@@ -134,26 +126,16 @@ class TestGanttGenerator:
         task2 = Task(id=1, name="Task 2", start_date=datetime(2025, 1, 4), duration=2)
 
         # Task 2 depends on Task 1
-        from p2gan.models import Dependency, DependencyType
-        dep = Dependency(
-            task_id=1,
-            depends_on=0,
-            type=DependencyType.FINISH_TO_START
-        )
-        task2.dependencies.append(dep)
+        task2.add_dependency(0, DependencyType.FINISH_TO_START)
 
         project.add_task(task1)
         project.add_task(task2)
 
-        generator = GanttGenerator(project)
-        xml_string = generator.generate_xml()
+        generator = GanttGenerator()
+        xml_string = generator.generate_xml(project)
 
         root = ET.fromstring(xml_string)
-        tasks_elem = root.find("tasks")
-        task2_elem = next(
-            (t for t in tasks_elem.findall("task") if t.get("name") == "Task 2"),
-            None
-        )
+        task2_elem = tasks_by_name(root)["Task 2"]
 
         depend_elem = task2_elem.find("depend")
         assert depend_elem is not None
@@ -163,9 +145,9 @@ class TestGanttGenerator:
     def test_empty_project(self):
         """Test generating empty project."""
         project = Project(name="Empty", start_date=datetime(2025, 1, 1))
-        generator = GanttGenerator(project)
+        generator = GanttGenerator()
 
-        xml_string = generator.generate_xml()
+        xml_string = generator.generate_xml(project)
         root = ET.fromstring(xml_string)
 
         assert root.tag == "project"
@@ -190,8 +172,8 @@ class TestGanttGenerator:
         )
         project.add_task(task)
 
-        generator = GanttGenerator(project)
-        xml_string = generator.generate_xml()
+        generator = GanttGenerator()
+        xml_string = generator.generate_xml(project)
 
         # Should not raise any parsing errors
         root = ET.fromstring(xml_string)
@@ -208,9 +190,22 @@ class TestGanttGenerator:
         )
         project.add_task(task)
 
-        generator = GanttGenerator(project)
-        xml_string = generator.generate_xml()
+        generator = GanttGenerator()
+        xml_string = generator.generate_xml(project)
 
         root = ET.fromstring(xml_string)
-        task_elem = root.find(".//task[@name='March Task']")
-        assert task_elem.get("start") == "2025-03-15"
\ No newline at end of file
+        task_elem = tasks_by_name(root)["March Task"]
+        assert task_elem.get("start") == "2025-03-15"
+    def test_dates_formatted_per_export(self):
+        """Test each export formats its own dates and keeps none of them afterwards."""
+        project = Project(name="Date Test", start_date=datetime(2025, 3, 15))
+        task = Task(id=0, name="Moving Task", start_date=datetime(2025, 3, 15), duration=1)
+        project.add_task(task)
+        generator = GanttGenerator()
+        generator.generate_xml(project)
+        assert generator.date_strings == {}
+
+        task.start_date = datetime(2025, 4, 1)
+        root = ET.fromstring(generator.generate_xml(project))
+        assert tasks_by_name(root)["Moving Task"].get("start") == "2025-04-01"
+        assert generator.date_strings == {}
@@ -1,10 +1,12 @@
 """Tests for p2gan.models module."""
 
 import pytest
-from datetime import datetime, timedelta
+import random
+from array import array
+from datetime import date, datetime, timedelta
 from p2gan.models import (
     Project, Task, Resource, Milestone, Dependency,
-    ResourceAllocation, TaskPriority, DependencyType
+    ResourceAllocation, TaskPriority, DependencyType, ConstraintType
 )
 
 
@@ -19,7 +21,7 @@ class TestProject:
             company="Test Company"
         )
         assert project.name == "Test Project"
-        assert project.start_date == datetime(2025, 1, 1)
+        assert project.start_date == date(2025, 1, 1)
         assert project.company == "Test Company"
         assert len(project.tasks) == 0
         assert len(project.resources) == 0
@@ -42,6 +44,115 @@ class TestProject:
         assert len(project.resources) == 1
         assert project.resources[0].name == "Alice"
 
+    def test_find_task_by_name_after_adding_subtask(self):
+        """Test name lookup sees subtasks added after a previous lookup."""
+        project = Project(name="Test", start_date=datetime(2025, 1, 1))
+        parent = Task(id=0, name="Parent", duration=0)
+        project.add_task(parent)
+        assert project.find_task_by_name("Child") is None
+
+        child = Task(id=1, name="Child", duration=2)
+        parent.add_subtask(child)
+        assert project.find_task_by_name("Child") is child
+        assert project.get_all_tasks() == [parent, child]
+
+    def test_find_task_by_name_walks_tree_once(self, monkeypatch):
+        """Test repeated name lookups reuse one walk of the task tree."""
+        walks = []
+        walk_tasks = Project._walk_tasks
+
+        def counting_walk(tasks):
+            walks.append(tasks)
+            return walk_tasks(tasks)
+
+        monkeypatch.setattr(Project, "_walk_tasks", staticmethod(counting_walk))
+        project = Project(name="Test", start_date=datetime(2025, 1, 1))
+        parent = Task(id=0, name="Parent", duration=0)
+        project.add_task(parent)
+        parent.add_subtask(Task(id=1, name="Child", duration=2))
+
+        assert project.find_task_by_name("Child").id == 1
+        walked = len(walks)  # Tasks and milestones, once each
+        assert project.find_task_by_name("Parent") is parent
+        assert project.find_task_by_name("Missing") is None
+        assert len(walks) == walked
+
+    def test_calculate_critical_path(self):
+        """Test the critical path follows the longest dependency chain."""
+        project = Project(name="Test", start_date=datetime(2025, 1, 1))
+        design = Task(id=0, name="Design", duration=3)
+        build = Task(id=1, name="Build", duration=5)
+        docs = Task(id=2, name="Docs", duration=2)
+        design.add_dependency(1)
+        docs.add_dependency(1)
+        for task in (design, build, docs):
+            project.add_task(task)
+
+        assert project.calculate_critical_path() == [design, build]
+
+    def test_validate_reports_circular_dependencies(self):
+        """Test validate() warns once per dependency cycle."""
+        project = Project(name="Test", start_date=datetime(2025, 1, 1))
+        tasks = [Task(id=i, name=f"Task {i}", duration=1) for i in range(4)]
+        tasks[0].add_dependency(1)
+        tasks[1].add_dependency(0)
+        tasks[2].add_dependency(3)
+        tasks[3].add_dependency(3)
+        for task in tasks:
+            project.add_task(task)
+
+        warnings = project.validate()
+        assert len(warnings) == 2
+        assert any("0, 1" in warning for warning in warnings)
+        assert any("Task 3" in warning for warning in warnings)
+
+
+@pytest.fixture(scope="module")
+def critical_path_kernels():
+    """The _critical_path module; its compiled-kernel tests are skipped without numba"""
+    pytest.importorskip("numba")
+    from p2gan import _critical_path
+    return _critical_path
+
+
+def run_critical_path_kernels(kernels, n, edges, durations, compiled):
+    """Run the critical path passes over an edge list, compiled or as plain Python"""
+    def kernel(name):
+        func = getattr(kernels, name)
+        return func if compiled else func.py_func
+
+    edge_src, edge_dst, edge_lag = (array('i', column) for column in zip(*edges))
+    succ_ptr, succ_idx, succ_lag, in_degree = kernels.build_successors(n, edge_src, edge_dst, edge_lag)
+    durations = array('i', durations)
+    topo = array('i', [0]) * n
+    count = kernel('topological_order')(succ_ptr, succ_idx, in_degree, topo)
+    earliest_finish = array('i', [0]) * n
+    kernel('compute_earliest')(durations, succ_ptr, succ_idx, succ_lag, topo, count, earliest_finish)
+    project_end = max((earliest_finish[u] for u in topo[:count]), default=0)
+    latest_finish = array('i', [0]) * n
+    kernel('compute_latest')(durations, succ_ptr, succ_idx, succ_lag, topo, count, project_end,
+                             latest_finish)
+    return list(topo[:count]), list(earliest_finish), list(latest_finish)
+
+
+class TestCriticalPathKernels:
+    """Test the numba critical path kernels against the same functions run as Python."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_compiled_matches_python(self, critical_path_kernels, seed):
+        """Test both paths order, schedule and bound a random graph with a cycle the same way."""
+        rng = random.Random(seed)
+        n = 60
+        edges = [(u, v, rng.randint(-1, 3)) for u in range(n) for v in range(u + 1, n)
+                 if rng.random() < 0.08]
+        edges += [(n - 1, n - 2, 0), (n - 2, n - 1, 0)]  # Left out of the order
+        durations = [rng.randint(0, 9) for _ in range(n)]
+
+        compiled = run_critical_path_kernels(critical_path_kernels, n, edges, durations, True)
+        python = run_critical_path_kernels(critical_path_kernels, n, edges, durations, False)
+        assert compiled == python
+        assert len(compiled[0]) == n - 2
+
 
 class TestTask:
     """Test Task model."""
@@ -89,6 +200,17 @@ class TestTask:
         assert len(task2.dependencies) == 1
         assert task2.dependencies[0].depends_on == 0
 
+    def test_containers_default_empty(self):
+        """Test container attributes start empty and are not shared."""
+        first = Task(id=0, name="First", duration=1)
+        second = Task(id=1, name="Second", duration=1, resource_ids=[3, 4])
+        first.subtasks.append(second)
+
+        assert second.subtasks == []
+        assert list(first.resource_ids) == []
+        assert list(second.resource_ids) == [3, 4]
+        assert first.dependencies == [] and first.allocations == {}
+
     def test_add_subtask(self):
         """Test hierarchical task structure."""
         parent = Task(id=0, name="Parent", start_date=datetime(2025, 1, 1), duration=10)
@@ -224,4 +346,9 @@ class TestTaskPriority:
         """Test priority enum names."""
         assert TaskPriority.LOW.name == "LOW"
         assert TaskPriority.NORMAL.name == "NORMAL"
-        assert TaskPriority.HIGH.name == "HIGH"
\ No newline at end of file
+        assert TaskPriority.HIGH.name == "HIGH"
+    def test_xml_strings(self):
+        """Test each enum member carries its value as an XML attribute string."""
+        for enum in (TaskPriority, DependencyType, ConstraintType):
+            for member in enum:
+                assert member.xml == str(member.value)
@@ -0,0 +1,143 @@
+"""Tests for p2gan.project_stats module."""
+
+import io
+import re
+import pytest
+from p2gan.project_stats import ProjectStats
+
+# Lines in every comment syntax ProjectStats knows, so each extension sees
+# its own comments next to other languages' comments counted as code
+SAMPLE_SOURCE = '''#!/usr/bin/env python3
+# A hash comment
+    # An indented hash comment  TODO: tidy
+x = 1  # Trailing comment
+"""A one-line docstring"""
+def f():
+    """A docstring
+    over several lines, fixme
+    """
+    return \'\'\'quoted\'\'\'
+\t\'\'\'
+\tAnother docstring\'\'\'
+
+// A slash comment
+\t// An indented slash comment, Hack
+int y = 2; // Trailing comment
+/* A one-line block comment */
+/*
+ * A block comment
+ * over several lines  TODO
+ */
+  */ a stray end of block comment
+z = y */ 2
+   \t
+\x0c
+'''
+
+SAMPLES = {
+    'lf': SAMPLE_SOURCE,
+    'crlf': SAMPLE_SOURCE.replace('\n', '\r\n'),
+    'cr': SAMPLE_SOURCE.replace('\n', '\r'),
+    'no_final_newline': SAMPLE_SOURCE.rstrip('\n'),
+    'unclosed': '"""\n/*\nstill a comment\n\n',
+    'non_ascii': 'café = 1  # todo\n# über\n/* été */\n　\n',
+    'empty': '',
+}
+
+EXTENSIONS = sorted(ProjectStats.COMMENT_PATTERNS) + ['.txt', '.md']
+
+
+def reference_counts(text, ext):
+    """Count lines the straightforward way: each comment pattern searched per line"""
+    patterns = ProjectStats.COMMENT_PATTERNS.get(ext, [])
+    end_tokens = ProjectStats.MULTILINE_END_TOKENS.get(ext, ())
+    counts = [0] * 7
+    in_multiline_comment = False
+    for line in io.StringIO(text, newline=None):  # Universal newlines
+        counts[0] += 1
+        upper = line.upper()
+        for index, marker in enumerate(('TODO', 'FIXME', 'HACK'), 4):
+            if marker in upper:
+                counts[index] += 1
+        if not line.strip():
+            counts[3] += 1
+            continue
+        if in_multiline_comment:
+            counts[2] += 1
+            in_multiline_comment = not any(token in line for token in end_tokens)
+            continue
+        for pattern, comment_type in patterns:
+            if pattern.search(line):
+                counts[2] += 1
+                if comment_type == 'multi_start':
+                    in_multiline_comment = not any(token in line for token in end_tokens)
+                break
+        else:
+            counts[1] += 1
+    return tuple(counts)
+
+
+@pytest.fixture(scope="module")
+def stats(tmp_path_factory):
+    """A ProjectStats instance, for its line counting"""
+    return ProjectStats(str(tmp_path_factory.mktemp("project")))
+
+
+class TestLineCounting:
+    """Test counting lines, code, comments and blanks."""
+
+    @pytest.mark.parametrize("sample", sorted(SAMPLES))
+    @pytest.mark.parametrize("ext", EXTENSIONS)
+    def test_counts_match_reference(self, stats, ext, sample):
+        """Test the Python line counting matches the reference for each comment syntax."""
+        text = SAMPLES[sample]
+        data = text.encode('utf-8')
+        assert stats._count_chunks((data,), ext) == reference_counts(text, ext)
+
+    @pytest.mark.parametrize("ext", EXTENSIONS)
+    def test_counts_span_chunks(self, stats, ext):
+        """Test a multi-line comment carries over from one chunk of lines to the next."""
+        text = SAMPLES['lf']
+        lines = text.encode('utf-8').splitlines(keepends=True)
+        chunks = [b''.join(lines[i:i + 3]) for i in range(0, len(lines), 3)]
+        assert stats._count_chunks(chunks, ext) == reference_counts(text, ext)
+
+    def test_unreadable_file(self, stats):
+        """Test a file that couldn't be read counts no lines."""
+        assert stats._count_lines(None, '.py') == (0, 0, 0, 0, 0, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def line_scan():
+    """The compiled ASCII line counting kernel; its tests are skipped without numba"""
+    pytest.importorskip("numba")
+    from p2gan import _line_scan
+    return _line_scan
+
+
+class TestAsciiLineScan:
+    """Test the numba line counting kernel against the Python line counting."""
+
+    @pytest.mark.parametrize("sample", sorted(set(SAMPLES) - {'non_ascii'}))
+    @pytest.mark.parametrize("ext", sorted(ProjectStats.COMMENT_PATTERNS))
+    def test_counts_match_python(self, stats, line_scan, ext, sample):
+        """Test the kernel counts every known comment syntax as the Python path does."""
+        syntax = line_scan.syntax_flags(ProjectStats.COMMENT_PATTERNS[ext],
+                                        ProjectStats.MULTILINE_END_TOKENS.get(ext, ()))
+        assert syntax is not None
+        data = SAMPLES[sample].encode('ascii')
+        assert line_scan.count_ascii_lines(data, syntax) == stats._count_chunks((data,), ext)
+
+    def test_non_ascii_falls_back(self, stats, line_scan):
+        """Test the kernel gives up on non-ASCII data, which the Python path then counts."""
+        syntax = stats._ascii_syntax['.py']
+        data = SAMPLES['non_ascii'].encode('utf-8')
+        assert line_scan.count_ascii_lines(data, syntax) is None
+        assert stats._count_lines(data, '.py') == reference_counts(SAMPLES['non_ascii'], '.py')
+
+    def test_unknown_syntax(self, line_scan):
+        """Test patterns the kernel doesn't know leave the extension to the Python path."""
+        patterns = [(re.compile(r'^\s*--'), 'single')]
+        assert line_scan.syntax_flags(patterns, ()) is None
+        patterns = ProjectStats.COMMENT_PATTERNS['.js']
+        assert line_scan.syntax_flags(patterns, ('-->',)) is None
@@ -0,0 +1,202 @@
+"""Tests for p2gan.stakeholders module."""
+
+import gc
+import json
+import weakref
+import pytest
+from p2gan import stakeholders as stakeholders_module
+from p2gan.stakeholders import Stakeholder, StakeholderManager
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path of a stakeholder cache file that doesn't exist yet."""
+    return tmp_path / "stakeholders.json"
+
+
+def read_cache(path):
+    """Load a stakeholder cache file as plain JSON."""
+    with open(path) as f:
+        return json.load(f)
+
+
+class TestStakeholderCache:
+    """Test saving the stakeholder cache."""
+
+    def test_manager_save_keeps_direct_edits(self, cache_path):
+        """Test a save by a manager method also writes stakeholders edited directly."""
+        manager = StakeholderManager(cache_path)
+        alice = manager.find_or_create("Alice")
+        alice.email = "alice@example.com"
+
+        manager.add_stakeholder(Stakeholder("Bob", "QA"))
+        assert read_cache(cache_path)["Alice"]["email"] == "alice@example.com"
+
+        alice.phone = "555-0100"
+        manager.assign_to_project("Bob", "Apollo")
+        data = read_cache(cache_path)
+        assert data["Alice"]["phone"] == "555-0100"
+        assert data["Bob"]["projects"] == ["Apollo"]
+
+    def test_batch_defers_write(self, cache_path):
+        """Test saves inside nested batch() blocks are written once, at the end."""
+        manager = StakeholderManager(cache_path)
+        with manager.batch():
+            manager.add_stakeholder(Stakeholder("Alice", "Developer"))
+            with manager.batch():
+                manager.add_stakeholder(Stakeholder("Bob", "QA"))
+            assert not cache_path.exists()
+            manager.assign_to_project("Alice", "Apollo")
+            assert not cache_path.exists()
+
+        data = read_cache(cache_path)
+        assert list(data) == ["Alice", "Bob"]
+        assert data["Alice"]["projects"] == ["Apollo"]
+
+    def test_batch_writes_on_error(self, cache_path):
+        """Test a batch() block left by an exception still writes its saves."""
+        manager = StakeholderManager(cache_path)
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.add_stakeholder(Stakeholder("Alice", "Developer"))
+                raise RuntimeError("boom")
+        assert list(read_cache(cache_path)) == ["Alice"]
+
+    def test_manager_is_collected(self, cache_path):
+        """Test a dropped manager is not kept alive after saving."""
+        manager = StakeholderManager(cache_path)
+        with manager.batch():
+            manager.add_stakeholder(Stakeholder("Alice", "Developer"))
+        ref = weakref.ref(manager)
+        del manager
+        gc.collect()
+        assert ref() is None
+
+    def test_reload(self, cache_path):
+        """Test a saved cache loads back into equal stakeholders."""
+        manager = StakeholderManager(cache_path)
+        manager.add_stakeholder(Stakeholder("Alice", "Developer", skills=["Python"],
+                                            aliases=["Ali"], projects={"Apollo"}))
+
+        reloaded = StakeholderManager(cache_path)
+        assert reloaded.stakeholders == manager.stakeholders
+
+    def test_write_replaces_file(self, cache_path):
+        """Test writes leave no temporary file behind."""
+        manager = StakeholderManager(cache_path)
+        manager.add_stakeholder(Stakeholder("Alice", "Developer"))
+        manager.add_stakeholder(Stakeholder("Bob", "QA"))
+        assert [p.name for p in cache_path.parent.iterdir()] == [cache_path.name]
+
+    def test_failed_write_keeps_previous_cache(self, cache_path, monkeypatch):
+        """Test a write that fails leaves the previous cache file intact."""
+        manager = StakeholderManager(cache_path)
+        manager.add_stakeholder(Stakeholder("Alice", "Developer"))
+        before = cache_path.read_bytes()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(stakeholders_module.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            manager.add_stakeholder(Stakeholder("Bob", "QA"))
+
+        assert cache_path.read_bytes() == before
+        assert [p.name for p in cache_path.parent.iterdir()] == [cache_path.name]
+
+
+class TestStakeholderLookup:
+    """Test finding stakeholders by name and alias."""
+
+    def test_alias_lookup_ignores_case(self, cache_path):
+        """Test aliases and names match case-insensitively."""
+        manager = StakeholderManager(cache_path)
+        alice = manager.add_stakeholder(Stakeholder("Alice", "Developer", aliases=["Ali"]))
+        assert manager.get_stakeholder("ALI") is alice
+        assert manager.get_stakeholder("alice") is alice
+        assert manager.get_stakeholder("Bob") is None
+
+    def test_alias_changed_in_place(self, cache_path):
+        """Test lookups see aliases added or removed after the index was built."""
+        manager = StakeholderManager(cache_path)
+        alice = manager.add_stakeholder(Stakeholder("Alice", "Developer", aliases=["Ali"]))
+        manager.add_stakeholder(Stakeholder("Bob", "QA"))
+        assert manager.get_stakeholder("ali") is alice
+        assert manager.get_stakeholder("al") is None
+
+        alice.aliases.append("Al")
+        assert manager.get_stakeholder("al") is alice
+
+        alice.aliases.remove("Ali")
+        assert manager.get_stakeholder("ali") is None
+
+        alice.aliases = ["Lissy"]
+        assert manager.get_stakeholder("LISSY") is alice
+        assert manager.get_stakeholder("al") is None
+
+    def test_first_match_wins_after_change(self, cache_path):
+        """Test an alias given to an earlier stakeholder takes precedence over a later one."""
+        manager = StakeholderManager(cache_path)
+        alice = manager.add_stakeholder(Stakeholder("Alice", "Developer"))
+        bob = manager.add_stakeholder(Stakeholder("Bob", "QA", aliases=["Boss"]))
+        assert manager.get_stakeholder("boss") is bob
+
+        alice.aliases += ["Boss"]
+        assert manager.get_stakeholder("boss") is alice
+
+        alice.name = "Ally"
+        assert manager.get_stakeholder("ally") is alice
+
+    def test_misses_use_the_index(self, cache_path, monkeypatch):
+        """Test unknown names are answered by the index, without rebuilding it."""
+        manager = StakeholderManager(cache_path)
+        for i in range(3):
+            manager.add_stakeholder(Stakeholder(f"Person {i}", "Developer"))
+        assert manager.get_stakeholder("nobody") is None
+
+        def fail_index(*args):
+            raise AssertionError("alias index rebuilt")
+
+        monkeypatch.setattr(StakeholderManager, "_index_names", staticmethod(fail_index))
+        monkeypatch.setattr(Stakeholder, "names_lower", property(fail_index))
+        for _ in range(3):
+            assert manager.get_stakeholder("nobody") is None
+            assert manager.get_stakeholder("PERSON 1") is not None
+
+    def test_import_finds_alias_changed_in_place(self, cache_path):
+        """Test importing resources matches aliases changed since the last lookup."""
+        manager = StakeholderManager(cache_path)
+        alice = manager.add_stakeholder(Stakeholder("Alice", "Developer"))
+        assert manager.get_stakeholder("ali") is None
+
+        alice.aliases.append("Ali")
+        manager.import_from_markdown("## Resources\n- Ali (Developer)\n- Bob (QA)\n", "Apollo")
+        assert list(manager.stakeholders) == ["Alice", "Bob"]
+        assert alice.projects == {"Apollo"}
+
+
+class TestCacheEncoding:
+    """Test the cache file's bytes don't depend on orjson being installed."""
+
+    @pytest.mark.parametrize("data", [
+        {"Zoë": {"name": "Zoë", "skills": ["日本語", "tab\there", "\x00\x7f "], "projects": []}},
+        {"Alice": {"availability": 0.5, "standard_rate": 1e-05, "overtime_rate": 2.5e16}},
+        {"Bob": {"availability": float("nan"), "standard_rate": float("inf"), "overtime_rate": -0.0}},
+        {"Carol": {"id": 2 ** 70, "nested": {"empty": {}, "list": [[], 1, True, None]}}},
+        {"Dana\udc80": {"aliases": ["lone surrogate"]}},
+    ], ids=["unicode", "exponent_floats", "non_finite", "big_int", "surrogate"])
+    def test_orjson_and_json_write_same_bytes(self, data, monkeypatch):
+        """Test orjson and the json fallback serialize the same data identically."""
+        pytest.importorskip("orjson")
+        with_orjson = stakeholders_module._dumps(data)
+        monkeypatch.setattr(stakeholders_module, "orjson", None)
+        assert stakeholders_module._dumps(data) == with_orjson
+        assert json.loads(with_orjson.decode("utf-8")).keys() == data.keys()
+
+    def test_fallback_writes_utf8(self, cache_path, monkeypatch):
+        """Test the json fallback writes non-ASCII names as UTF-8, not escapes."""
+        monkeypatch.setattr(stakeholders_module, "orjson", None)
+        manager = StakeholderManager(cache_path)
+        manager.add_stakeholder(Stakeholder("Zoë", "Développeuse"))
+        assert "Zoë".encode("utf-8") in cache_path.read_bytes()
+        assert StakeholderManager(cache_path).stakeholders == manager.stakeholders